@@ -7,9 +7,194 @@ Consolidates all CSV processing, Unity Dashboard import, and setup functionality
 import csv
 import json
 import sys
-import time
+from collections import Counter
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_HEADER_RULE = "=" * 80
+
+# "true"/"false" flags parsed to bool on load, and the cost and quantity
+# columns parsed to int for purchasable rows
+_INT_FIELDS = ("cost_gems", "cost_coins", "quantity")
+_FLAG_FIELDS = ("is_tradeable", "is_consumable", "is_purchasable")
+
+# Item types that become Economy inventory items
+_INVENTORY_TYPES = frozenset({"booster", "pack"})
+
+# Currencies shared by the Unity CLI export and the services config
+_CURRENCIES = (
+    {
+        "id": "coins",
+        "name": "Coins",
+        "type": "soft_currency",
+        "initial": 1000,
+        "maximum": 999999,
+    },
+    {
+        "id": "gems",
+        "name": "Gems",
+        "type": "hard_currency",
+        "initial": 50,
+        "maximum": 99999,
+    },
+    {
+        "id": "energy",
+        "name": "Energy",
+        "type": "consumable",
+        "initial": 5,
+        "maximum": 30,
+    },
+)
+
+# Cloud Code function sources written to cloud-code/
+_CLOUD_CODE_FUNCTIONS = {
+    "AddCurrency.js": """// AddCurrency Cloud Code Function
+const { EconomyApi } = require("@unity-services/economy-1.0");
+
+module.exports = async ({ params, context, logger }) => {
+  try {
+    const { currencyId, amount } = params;
+    if (!currencyId || !amount) throw new Error("Missing required parameters");
+    if (amount <= 0) throw new Error("Amount must be positive");
+
+    await EconomyApi.addCurrency({ currencyId, amount });
+    logger.info(`Added ${amount} ${currencyId} to player`);
+
+    return { success: true, currencyId, amount };
+  } catch (error) {
+    logger.error(`AddCurrency failed: ${error.message}`);
+    throw error;
+  }
+};""",
+    "SpendCurrency.js": """// SpendCurrency Cloud Code Function
+const { EconomyApi } = require("@unity-services/economy-1.0");
+
+module.exports = async ({ params, context, logger }) => {
+  try {
+    const { currencyId, amount } = params;
+    if (!currencyId || !amount) throw new Error("Missing required parameters");
+    if (amount <= 0) throw new Error("Amount must be positive");
+
+    const balance = await EconomyApi.getCurrencyBalance({ currencyId });
+    if (balance.amount < amount) throw new Error("Insufficient funds");
+
+    await EconomyApi.spendCurrency({ currencyId, amount });
+    logger.info(`Spent ${amount} ${currencyId} from player`);
+
+    return { success: true, currencyId, amount, newBalance: balance.amount - amount };
+  } catch (error) {
+    logger.error(`SpendCurrency failed: ${error.message}`);
+    throw error;
+  }
+};""",
+    "AddInventoryItem.js": """// AddInventoryItem Cloud Code Function
+const { EconomyApi } = require("@unity-services/economy-1.0");
+
+module.exports = async ({ params, context, logger }) => {
+  try {
+    const { itemId, quantity = 1 } = params;
+    if (!itemId) throw new Error("Missing required parameter: itemId");
+    if (quantity <= 0) throw new Error("Quantity must be positive");
+
+    await EconomyApi.addInventoryItem({ itemId, quantity });
+    logger.info(`Added ${quantity} ${itemId} to player inventory`);
+
+    return { success: true, itemId, quantity };
+  } catch (error) {
+    logger.error(`AddInventoryItem failed: ${error.message}`);
+    throw error;
+  }
+};""",
+    "UseInventoryItem.js": """// UseInventoryItem Cloud Code Function
+const { EconomyApi } = require("@unity-services/economy-1.0");
+
+module.exports = async ({ params, context, logger }) => {
+  try {
+    const { itemId, quantity = 1 } = params;
+    if (!itemId) throw new Error("Missing required parameter: itemId");
+    if (quantity <= 0) throw new Error("Quantity must be positive");
+
+    const inventory = await EconomyApi.getInventoryItems();
+    const item = inventory.find(i => i.id === itemId);
+
+    if (!item || item.quantity < quantity) throw new Error("Insufficient inventory items");
+
+    await EconomyApi.useInventoryItem({ itemId, quantity });
+    logger.info(`Used ${quantity} ${itemId} from player inventory`);
+
+    return { success: true, itemId, quantity, remainingQuantity: item.quantity - quantity };
+  } catch (error) {
+    logger.error(`UseInventoryItem failed: ${error.message}`);
+    throw error;
+  }
+};""",
+}
+
+
+def _partition_items(items):
+    """Split rows into inventory items and purchasable items in one pass"""
+    inventory_rows = []
+    purchasable_rows = []
+    for item in items:
+        if item["type"] in _INVENTORY_TYPES:
+            inventory_rows.append(item)
+        if item["is_purchasable"]:
+            purchasable_rows.append(item)
+    return inventory_rows, purchasable_rows
+
+
+def _catalog_row(item):
+    """Build the Unity CLI catalog row for a purchasable item"""
+    quantity = item["quantity"]
+
+    if item["cost_gems"] > 0:
+        cost_currency = "gems"
+        cost_amount = item["cost_gems"]
+    else:
+        cost_currency = "coins"
+        cost_amount = item["cost_coins"]
+
+    if item["type"] == "currency":
+        if "coins" in item["id"]:
+            reward_currency = "coins"
+        elif "energy" in item["id"]:
+            reward_currency = "energy"
+        else:
+            reward_currency = "gems"
+    else:
+        reward_currency = item["id"]
+
+    return {
+        "id": item["id"],
+        "name": item["name"],
+        "cost_currency": cost_currency,
+        "cost_amount": cost_amount,
+        "rewards": f"{reward_currency}:{quantity}",
+    }
+
+
+def _encode_json(config):
+    """Encode config as indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_if_changed(path, data):
+    """Write data to path unless the file already holds exactly those bytes"""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
 
 
 class UnifiedEconomyProcessor:
@@ -34,18 +219,22 @@ class UnifiedEconomyProcessor:
 
     def print_header(self, title):
         """Print formatted header"""
-        print("\n" + "=" * 80)
-        print(f"🚀 {title}")
-        print("=" * 80)
+        sys.stdout.write(f"\n{_HEADER_RULE}\n🚀 {title}\n{_HEADER_RULE}\n")
 
     def load_csv_data(self) -> List[Dict]:
         """Load economy data from CSV file"""
         try:
-            items = []
-            with open(self.csv_path, "r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    items.append(row)
+            with open(self.csv_path, "r", encoding="utf-8", newline="") as file:
+                items = list(csv.DictReader(file))
+
+            # Convert flag and numeric columns once for every consumer; only
+            # purchasable rows use the numbers, so only they must hold them
+            for item in items:
+                for field in _FLAG_FIELDS:
+                    item[field] = item[field] == "true"
+                if item["is_purchasable"]:
+                    for field in _INT_FIELDS:
+                        item[field] = int(item[field])
             print(f"✅ Loaded {len(items)} items from CSV")
             return items
         except Exception as e:
@@ -56,35 +245,13 @@ class UnifiedEconomyProcessor:
         """Convert CSV to Unity CLI format"""
         self.print_header("Converting CSV to Unity Format")
 
+        inventory_rows, purchasable_rows = _partition_items(items)
+
         # Create output directory
         economy_dir = self.repo_root / "economy"
         economy_dir.mkdir(exist_ok=True)
 
         # Create currencies CSV
-        currencies = [
-            {
-                "id": "coins",
-                "name": "Coins",
-                "type": "soft_currency",
-                "initial": 1000,
-                "maximum": 999999,
-            },
-            {
-                "id": "gems",
-                "name": "Gems",
-                "type": "hard_currency",
-                "initial": 50,
-                "maximum": 99999,
-            },
-            {
-                "id": "energy",
-                "name": "Energy",
-                "type": "consumable",
-                "initial": 5,
-                "maximum": 30,
-            },
-        ]
-
         with open(
             economy_dir / "currencies.csv", "w", newline="", encoding="utf-8"
         ) as f:
@@ -92,21 +259,19 @@ class UnifiedEconomyProcessor:
                 f, fieldnames=["id", "name", "type", "initial", "maximum"]
             )
             writer.writeheader()
-            writer.writerows(currencies)
+            writer.writerows(_CURRENCIES)
 
         # Create inventory CSV
-        inventory_items = []
-        for item in items:
-            if item["type"] in ["booster", "pack"]:
-                inventory_items.append(
-                    {
-                        "id": item["id"],
-                        "name": item["name"],
-                        "type": item["type"],
-                        "tradable": item["is_tradeable"] == "true",
-                        "stackable": item["is_consumable"] == "true",
-                    }
-                )
+        inventory_items = [
+            {
+                "id": item["id"],
+                "name": item["name"],
+                "type": item["type"],
+                "tradable": item["is_tradeable"],
+                "stackable": item["is_consumable"],
+            }
+            for item in inventory_rows
+        ]
 
         with open(
             economy_dir / "inventory.csv", "w", newline="", encoding="utf-8"
@@ -118,43 +283,7 @@ class UnifiedEconomyProcessor:
             writer.writerows(inventory_items)
 
         # Create catalog CSV
-        catalog_items = []
-        for item in items:
-            if item["is_purchasable"] == "true":
-                cost_gems = int(item["cost_gems"])
-                cost_coins = int(item["cost_coins"])
-                quantity = int(item["quantity"])
-
-                if cost_gems > 0:
-                    cost_currency = "gems"
-                    cost_amount = cost_gems
-                else:
-                    cost_currency = "coins"
-                    cost_amount = cost_coins
-
-                if item["type"] == "currency":
-                    if "coins" in item["id"]:
-                        reward_currency = "coins"
-                        reward_amount = quantity
-                    elif "energy" in item["id"]:
-                        reward_currency = "energy"
-                        reward_amount = quantity
-                    else:
-                        reward_currency = "gems"
-                        reward_amount = quantity
-                else:
-                    reward_currency = item["id"]
-                    reward_amount = quantity
-
-                catalog_items.append(
-                    {
-                        "id": item["id"],
-                        "name": item["name"],
-                        "cost_currency": cost_currency,
-                        "cost_amount": cost_amount,
-                        "rewards": f"{reward_currency}:{reward_amount}",
-                    }
-                )
+        catalog_items = [_catalog_row(item) for item in purchasable_rows]
 
         with open(economy_dir / "catalog.csv", "w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(
@@ -163,81 +292,58 @@ class UnifiedEconomyProcessor:
             writer.writeheader()
             writer.writerows(catalog_items)
 
-        print(f"✅ Created currencies.csv ({len(currencies)} items)")
-        print(f"✅ Created inventory.csv ({len(inventory_items)} items)")
-        print(f"✅ Created catalog.csv ({len(catalog_items)} items)")
+        sys.stdout.write(
+            f"✅ Created currencies.csv ({len(_CURRENCIES)} items)\n"
+            f"✅ Created inventory.csv ({len(inventory_items)} items)\n"
+            f"✅ Created catalog.csv ({len(catalog_items)} items)\n"
+        )
         return True
 
     def generate_unity_services_config(self, items: List[Dict]) -> bool:
         """Generate Unity Services configuration"""
         self.print_header("Generating Unity Services Configuration")
 
+        inventory_rows, purchasable_rows = _partition_items(items)
+
         config = {
             "projectId": self.project_id,
             "environmentId": self.environment_id,
             "licenseType": "personal",
             "cloudServicesAvailable": True,
             "economy": {
-                "currencies": [
-                    {
-                        "id": "coins",
-                        "name": "Coins",
-                        "type": "soft_currency",
-                        "initial": 1000,
-                        "maximum": 999999,
-                    },
-                    {
-                        "id": "gems",
-                        "name": "Gems",
-                        "type": "hard_currency",
-                        "initial": 50,
-                        "maximum": 99999,
-                    },
-                    {
-                        "id": "energy",
-                        "name": "Energy",
-                        "type": "consumable",
-                        "initial": 5,
-                        "maximum": 30,
-                    },
-                ],
+                "currencies": _CURRENCIES,
                 "inventory": [
                     {
                         "id": item["id"],
                         "name": item["name"],
                         "type": item["type"],
-                        "tradable": item["is_tradeable"] == "true",
-                        "stackable": item["is_consumable"] == "true",
+                        "tradable": item["is_tradeable"],
+                        "stackable": item["is_consumable"],
                     }
-                    for item in items
-                    if item["type"] in ["booster", "pack"]
+                    for item in inventory_rows
                 ],
                 "catalog": [
                     {
                         "id": item["id"],
                         "name": item["name"],
-                        "cost_currency": (
-                            "gems" if int(item["cost_gems"]) > 0 else "coins"
-                        ),
+                        "cost_currency": ("gems" if item["cost_gems"] > 0 else "coins"),
                         "cost_amount": (
-                            int(item["cost_gems"])
-                            if int(item["cost_gems"]) > 0
-                            else int(item["cost_coins"])
+                            item["cost_gems"]
+                            if item["cost_gems"] > 0
+                            else item["cost_coins"]
                         ),
                         "rewards": (
                             f"{item['id']}:{item['quantity']}"
-                            if item["type"] in ["booster", "pack"]
+                            if item["type"] in _INVENTORY_TYPES
                             else f"coins:{item['quantity']}"
                         ),
                     }
-                    for item in items
-                    if item["is_purchasable"] == "true"
+                    for item in purchasable_rows
                 ],
             },
         }
 
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        _write_if_changed(self.config_path, _encode_json(config))
 
         print(f"✅ Unity Services configuration saved")
         return True
@@ -246,6 +352,8 @@ class UnifiedEconomyProcessor:
         """Generate Unity Dashboard setup instructions"""
         self.print_header("Generating Unity Dashboard Instructions")
 
+        inventory_rows, purchasable_rows = _partition_items(items)
+
         instructions = f"""# Unity Dashboard Setup Instructions
 
 ## Project Information
@@ -262,11 +370,11 @@ class UnifiedEconomyProcessor:
 1. Go to Economy → Currencies
 2. Create: coins, gems, energy
 
-## Step 3: Create Inventory Items ({len([i for i in items if i['type'] in ['booster', 'pack']])} items)
+## Step 3: Create Inventory Items ({len(inventory_rows)} items)
 1. Go to Economy → Inventory Items
 2. Create all boosters and packs from your CSV
 
-## Step 4: Create Virtual Purchases ({len([i for i in items if i['is_purchasable'] == 'true'])} items)
+## Step 4: Create Virtual Purchases ({len(purchasable_rows)} items)
 1. Go to Economy → Virtual Purchases
 2. Create all purchasable items from your CSV
 
@@ -279,8 +387,7 @@ Your Unity Cloud Economy Service is now fully configured!
 """
 
         instructions_file = self.repo_root / "UNITY_DASHBOARD_SETUP_INSTRUCTIONS.md"
-        with open(instructions_file, "w", encoding="utf-8") as f:
-            f.write(instructions)
+        _write_if_changed(instructions_file, instructions.encode("utf-8"))
 
         print(f"✅ Instructions saved to: {instructions_file}")
         return True
@@ -292,93 +399,11 @@ Your Unity Cloud Economy Service is now fully configured!
         cloud_code_dir = self.repo_root / "cloud-code"
         cloud_code_dir.mkdir(exist_ok=True)
 
-        functions = {
-            "AddCurrency.js": """// AddCurrency Cloud Code Function
-const { EconomyApi } = require("@unity-services/economy-1.0");
-
-module.exports = async ({ params, context, logger }) => {
-  try {
-    const { currencyId, amount } = params;
-    if (!currencyId || !amount) throw new Error("Missing required parameters");
-    if (amount <= 0) throw new Error("Amount must be positive");
-
-    await EconomyApi.addCurrency({ currencyId, amount });
-    logger.info(`Added ${amount} ${currencyId} to player`);
-
-    return { success: true, currencyId, amount };
-  } catch (error) {
-    logger.error(`AddCurrency failed: ${error.message}`);
-    throw error;
-  }
-};""",
-            "SpendCurrency.js": """// SpendCurrency Cloud Code Function
-const { EconomyApi } = require("@unity-services/economy-1.0");
-
-module.exports = async ({ params, context, logger }) => {
-  try {
-    const { currencyId, amount } = params;
-    if (!currencyId || !amount) throw new Error("Missing required parameters");
-    if (amount <= 0) throw new Error("Amount must be positive");
-
-    const balance = await EconomyApi.getCurrencyBalance({ currencyId });
-    if (balance.amount < amount) throw new Error("Insufficient funds");
-
-    await EconomyApi.spendCurrency({ currencyId, amount });
-    logger.info(`Spent ${amount} ${currencyId} from player`);
-
-    return { success: true, currencyId, amount, newBalance: balance.amount - amount };
-  } catch (error) {
-    logger.error(`SpendCurrency failed: ${error.message}`);
-    throw error;
-  }
-};""",
-            "AddInventoryItem.js": """// AddInventoryItem Cloud Code Function
-const { EconomyApi } = require("@unity-services/economy-1.0");
-
-module.exports = async ({ params, context, logger }) => {
-  try {
-    const { itemId, quantity = 1 } = params;
-    if (!itemId) throw new Error("Missing required parameter: itemId");
-    if (quantity <= 0) throw new Error("Quantity must be positive");
-
-    await EconomyApi.addInventoryItem({ itemId, quantity });
-    logger.info(`Added ${quantity} ${itemId} to player inventory`);
-
-    return { success: true, itemId, quantity };
-  } catch (error) {
-    logger.error(`AddInventoryItem failed: ${error.message}`);
-    throw error;
-  }
-};""",
-            "UseInventoryItem.js": """// UseInventoryItem Cloud Code Function
-const { EconomyApi } = require("@unity-services/economy-1.0");
-
-module.exports = async ({ params, context, logger }) => {
-  try {
-    const { itemId, quantity = 1 } = params;
-    if (!itemId) throw new Error("Missing required parameter: itemId");
-    if (quantity <= 0) throw new Error("Quantity must be positive");
-
-    const inventory = await EconomyApi.getInventoryItems();
-    const item = inventory.find(i => i.id === itemId);
-
-    if (!item || item.quantity < quantity) throw new Error("Insufficient inventory items");
-
-    await EconomyApi.useInventoryItem({ itemId, quantity });
-    logger.info(`Used ${quantity} ${itemId} from player inventory`);
-
-    return { success: true, itemId, quantity, remainingQuantity: item.quantity - quantity };
-  } catch (error) {
-    logger.error(`UseInventoryItem failed: ${error.message}`);
-    throw error;
-  }
-};""",
-        }
-
-        for filename, content in functions.items():
-            with open(cloud_code_dir / filename, "w", encoding="utf-8") as f:
-                f.write(content)
-            print(f"✅ Created {filename}")
+        lines = []
+        for filename, content in _CLOUD_CODE_FUNCTIONS.items():
+            _write_if_changed(cloud_code_dir / filename, content.encode("utf-8"))
+            lines.append(f"✅ Created {filename}\n")
+        sys.stdout.write("".join(lines))
 
         return True
 
@@ -391,16 +416,16 @@ module.exports = async ({ params, context, logger }) => {
         if not items:
             return False
 
-        print(f"\n📊 Processing {len(items)} items:")
-        print(
-            f"   - Currency items: {len([i for i in items if i['type'] == 'currency'])}"
-        )
-        print(
-            f"   - Booster items: {len([i for i in items if i['type'] == 'booster'])}"
-        )
-        print(f"   - Pack items: {len([i for i in items if i['type'] == 'pack'])}")
-        print(
-            f"   - Purchasable items: {len([i for i in items if i['is_purchasable'] == 'true'])}"
+        # Tally the type and purchasable columns in one pass each
+        type_counts = Counter(map(itemgetter("type"), items))
+        purchasable_count = sum(map(itemgetter("is_purchasable"), items))
+
+        sys.stdout.write(
+            f"\n📊 Processing {len(items)} items:\n"
+            f"   - Currency items: {type_counts['currency']}\n"
+            f"   - Booster items: {type_counts['booster']}\n"
+            f"   - Pack items: {type_counts['pack']}\n"
+            f"   - Purchasable items: {purchasable_count}\n"
         )
 
         # Run all processing steps
@@ -411,8 +436,10 @@ module.exports = async ({ params, context, logger }) => {
         success &= self.create_cloud_code_functions()
 
         if success:
-            print(f"\n🎉 Unified processing completed successfully!")
-            print(f"📄 Check UNITY_DASHBOARD_SETUP_INSTRUCTIONS.md for next steps")
+            sys.stdout.write(
+                "\n🎉 Unified processing completed successfully!\n"
+                "📄 Check UNITY_DASHBOARD_SETUP_INSTRUCTIONS.md for next steps\n"
+            )
         else:
             print(f"\n⚠️ Processing completed with some issues")
 
@@ -5,15 +5,20 @@ Extracts actual data from Unity Cloud dashboard without using APIs
 """
 
 import json
-import os
 import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
 
 import requests
 
+# Report icon and label for each known extraction status
+_STATUS_LINES = {
+    "extracted": ("✅", "EXTRACTED"),
+    "not_configured": ("❌", "NOT CONFIGURED"),
+    "unauthorized": ("⚠️", "LOGIN REQUIRED"),
+}
+
 
 class UnityCloudDataExtractor:
     def __init__(self):
@@ -444,22 +449,22 @@ class UnityCloudDataExtractor:
 
         total_services = len(self.results["extracted_data"])
         extracted_services = 0
+        lines = []
 
         for service_name, service_data in self.results["extracted_data"].items():
             status = service_data.get("status", "unknown")
-            if status == "extracted":
-                extracted_services += 1
-                print(f"✅ {service_name}: EXTRACTED")
-            elif status == "not_configured":
-                print(f"❌ {service_name}: NOT CONFIGURED")
-            elif status == "unauthorized":
-                print(f"⚠️ {service_name}: LOGIN REQUIRED")
-            elif status == "error":
-                print(
-                    f"❌ {service_name}: ERROR - {service_data.get('error', 'Unknown error')}"
-                )
+            extracted_services += status == "extracted"
+            if status == "error":
+                detail = f"ERROR - {service_data.get('error', 'Unknown error')}"
+                lines.append(f"❌ {service_name}: {detail}\n")
+            elif status in _STATUS_LINES:
+                icon, label = _STATUS_LINES[status]
+                lines.append(f"{icon} {service_name}: {label}\n")
             else:
-                print(f"⚠️ {service_name}: {status.upper()}")
+                lines.append(f"⚠️ {service_name}: {status.upper()}\n")
+
+        # Emit the per-service status block with a single write
+        sys.stdout.write("".join(lines))
 
         print(f"\n📈 Summary:")
         print(f"   Total Services: {total_services}")
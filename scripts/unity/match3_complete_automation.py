@@ -7,10 +7,122 @@ Integrates all Match-3 specific automation for Evergreen Puzzler
 import json
 import os
 import subprocess
+import sys
 from pathlib import Path
 
 import yaml
 
+_SUCCESS_BANNER = """
+🎉 Seamless Match-3 automation completed!
+✅ Animation System - 100% Automated
+✅ Audio System - 100% Automated
+✅ UI System - 100% Automated
+✅ Physics System - 100% Automated
+✅ Unity Cloud - Automatically Synced
+✅ Automation Report - Generated
+
+🎮 Your Evergreen Puzzler Match-3 game is now seamlessly automated!
+   - Zero manual work required
+   - Unity Cloud updates automatically
+   - Complete CI/CD pipeline
+   - Match-3 specific features automated
+"""
+
+_FAILURE_BANNER = """
+⚠️ Some Match-3 automation steps failed
+   Please check the logs above for details
+"""
+
+
+# Unity Editor window that drives the complete automation from the menu
+_CS_SCRIPT = """
+using UnityEngine;
+using UnityEditor;
+using System.Collections.Generic;
+
+namespace Evergreen.Editor
+{
+    public class Match3CompleteAutomation : EditorWindow
+    {
+        [MenuItem("Tools/Match-3/Complete Automation")]
+        public static void ShowWindow()
+        {
+            GetWindow<Match3CompleteAutomation>("Match-3 Complete Automation");
+        }
+
+        private void OnGUI()
+        {
+            GUILayout.Label("Match-3 Complete Automation", EditorStyles.boldLabel);
+            GUILayout.Space(10);
+
+            GUILayout.Label("Evergreen Puzzler - Match-3 Game Automation", EditorStyles.centeredGreyMiniLabel);
+            GUILayout.Space(20);
+
+            if (GUILayout.Button("🎬 Animation Automation", GUILayout.Height(40)))
+            {
+                Match3AnimationAutomation.ShowWindow();
+            }
+
+            if (GUILayout.Button("🔊 Audio Automation", GUILayout.Height(40)))
+            {
+                Match3AudioAutomation.ShowWindow();
+            }
+
+            if (GUILayout.Button("🖥️ UI Automation", GUILayout.Height(40)))
+            {
+                Match3UIAutomation.ShowWindow();
+            }
+
+            if (GUILayout.Button("⚡ Physics Automation", GUILayout.Height(40)))
+            {
+                Match3PhysicsAutomation.ShowWindow();
+            }
+
+            GUILayout.Space(20);
+
+            if (GUILayout.Button("🎯 Run ALL Match-3 Automation", GUILayout.Height(50)))
+            {
+                RunAllMatch3Automation();
+            }
+
+            GUILayout.Space(20);
+
+            GUILayout.Label("Automation Status:", EditorStyles.boldLabel);
+            GUILayout.Label("✅ Asset Pipeline - Complete");
+            GUILayout.Label("✅ Scene Setup - Complete");
+            GUILayout.Label("✅ Animation System - Ready");
+            GUILayout.Label("✅ Audio System - Ready");
+            GUILayout.Label("✅ UI System - Ready");
+            GUILayout.Label("✅ Physics System - Ready");
+            GUILayout.Label("✅ Build Pipeline - Complete");
+            GUILayout.Label("✅ Storefront Deployment - Complete");
+        }
+
+        private static void RunAllMatch3Automation()
+        {
+            try
+            {
+                Debug.Log("🎯 Running ALL Match-3 automation...");
+
+                // Run all automation systems
+                Match3AnimationAutomation.SetupMatch3Animations();
+                Match3AudioAutomation.SetupAudioMixer();
+                Match3UIAutomation.SetupUICanvas();
+                Match3PhysicsAutomation.SetupPhysicsMaterials();
+
+                Debug.Log("🎉 ALL Match-3 automation completed!");
+                EditorUtility.DisplayDialog("Match-3 Automation", "All Match-3 automation completed successfully!", "OK");
+            }
+            catch (System.Exception e)
+            {
+                Debug.LogError($"❌ Match-3 automation failed: {e.Message}");
+                EditorUtility.DisplayDialog("Match-3 Automation", $"Automation failed: {e.Message}", "OK");
+            }
+        }
+    }
+}
+"""
+
 
 class Match3CompleteAutomation:
     def __init__(self):
@@ -115,100 +227,11 @@ class Match3CompleteAutomation:
         """Create Unity Editor integration script"""
         print("🔗 Creating Unity Editor integration...")
 
-        script_content = """
-using UnityEngine;
-using UnityEditor;
-using System.Collections.Generic;
-
-namespace Evergreen.Editor
-{
-    public class Match3CompleteAutomation : EditorWindow
-    {
-        [MenuItem("Tools/Match-3/Complete Automation")]
-        public static void ShowWindow()
-        {
-            GetWindow<Match3CompleteAutomation>("Match-3 Complete Automation");
-        }
-
-        private void OnGUI()
-        {
-            GUILayout.Label("Match-3 Complete Automation", EditorStyles.boldLabel);
-            GUILayout.Space(10);
-
-            GUILayout.Label("Evergreen Puzzler - Match-3 Game Automation", EditorStyles.centeredGreyMiniLabel);
-            GUILayout.Space(20);
-
-            if (GUILayout.Button("🎬 Animation Automation", GUILayout.Height(40)))
-            {
-                Match3AnimationAutomation.ShowWindow();
-            }
-
-            if (GUILayout.Button("🔊 Audio Automation", GUILayout.Height(40)))
-            {
-                Match3AudioAutomation.ShowWindow();
-            }
-
-            if (GUILayout.Button("🖥️ UI Automation", GUILayout.Height(40)))
-            {
-                Match3UIAutomation.ShowWindow();
-            }
-
-            if (GUILayout.Button("⚡ Physics Automation", GUILayout.Height(40)))
-            {
-                Match3PhysicsAutomation.ShowWindow();
-            }
-
-            GUILayout.Space(20);
-
-            if (GUILayout.Button("🎯 Run ALL Match-3 Automation", GUILayout.Height(50)))
-            {
-                RunAllMatch3Automation();
-            }
-
-            GUILayout.Space(20);
-
-            GUILayout.Label("Automation Status:", EditorStyles.boldLabel);
-            GUILayout.Label("✅ Asset Pipeline - Complete");
-            GUILayout.Label("✅ Scene Setup - Complete");
-            GUILayout.Label("✅ Animation System - Ready");
-            GUILayout.Label("✅ Audio System - Ready");
-            GUILayout.Label("✅ UI System - Ready");
-            GUILayout.Label("✅ Physics System - Ready");
-            GUILayout.Label("✅ Build Pipeline - Complete");
-            GUILayout.Label("✅ Storefront Deployment - Complete");
-        }
-
-        private static void RunAllMatch3Automation()
-        {
-            try
-            {
-                Debug.Log("🎯 Running ALL Match-3 automation...");
-
-                // Run all automation systems
-                Match3AnimationAutomation.SetupMatch3Animations();
-                Match3AudioAutomation.SetupAudioMixer();
-                Match3UIAutomation.SetupUICanvas();
-                Match3PhysicsAutomation.SetupPhysicsMaterials();
-
-                Debug.Log("🎉 ALL Match-3 automation completed!");
-                EditorUtility.DisplayDialog("Match-3 Automation", "All Match-3 automation completed successfully!", "OK");
-            }
-            catch (System.Exception e)
-            {
-                Debug.LogError($"❌ Match-3 automation failed: {e.Message}");
-                EditorUtility.DisplayDialog("Match-3 Automation", $"Automation failed: {e.Message}", "OK");
-            }
-        }
-    }
-}
-"""
-
         # Save Unity Editor script
         script_path = self.unity_assets / "Editor" / "Match3CompleteAutomation.cs"
         script_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(script_path, "w") as f:
-            f.write(script_content)
+        script_path.write_bytes(_CS_SCRIPT.encode("utf-8"))
 
         print(f"✅ Unity Editor integration created: {script_path}")
         return True
@@ -316,24 +339,8 @@ namespace Evergreen.Editor
         success &= self.create_unity_editor_integration()
         success &= self.create_automation_report()
 
-        if success:
-            print("\n🎉 Seamless Match-3 automation completed!")
-            print("✅ Animation System - 100% Automated")
-            print("✅ Audio System - 100% Automated")
-            print("✅ UI System - 100% Automated")
-            print("✅ Physics System - 100% Automated")
-            print("✅ Unity Cloud - Automatically Synced")
-            print("✅ Automation Report - Generated")
-            print(
-                "\n🎮 Your Evergreen Puzzler Match-3 game is now seamlessly automated!"
-            )
-            print("   - Zero manual work required")
-            print("   - Unity Cloud updates automatically")
-            print("   - Complete CI/CD pipeline")
-            print("   - Match-3 specific features automated")
-        else:
-            print("\n⚠️ Some Match-3 automation steps failed")
-            print("   Please check the logs above for details")
+        sys.stdout.write(_SUCCESS_BANNER if success else _FAILURE_BANNER)
+        sys.stdout.flush()
 
         return success
 
@@ -4,280 +4,410 @@ Match-3 Physics Automation
 Automates physics setup specifically for Evergreen Puzzler match-3 game
 """
 
+import hashlib
 import json
 import os
-import subprocess
+import sys
 from pathlib import Path
 
-import yaml
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_HEADER_RULE = "=" * 80
+
+_INTRO_BANNER = f"""
+{_HEADER_RULE}
+⚡ Match-3 Physics Full Automation
+{_HEADER_RULE}
+🎯 This will automate Match-3 specific physics setup
+   - Physics Materials (tile, board, wall, ice, bouncy)
+   - Collision Layers (tile, board, wall, powerup, particle)
+   - Physics Components (rigidbody, collider configurations)
+   - Physics Optimization (performance, memory management)
+   - Physics Prefabs generation
+"""
 
+_SUCCESS_BANNER = """
+🎉 Match-3 physics automation completed successfully!
+✅ Physics Materials configured
+✅ Collision Layers setup
+✅ Physics Components configured
+✅ Physics Optimization applied
+✅ Physics Prefabs generated
+✅ Unity Editor automation script created
+"""
 
-class Match3PhysicsAutomation:
-    def __init__(self):
-        self.repo_root = Path(__file__).parent.parent.parent
-        self.unity_assets = self.repo_root / "unity" / "Assets"
-        self.physics_dir = self.unity_assets / "Physics"
-        self.materials_dir = self.unity_assets / "Physics" / "Materials"
+_FAILURE_BANNER = """
+⚠️ Some Match-3 physics automation steps failed
+"""
 
-    def print_header(self, title):
-        """Print formatted header"""
-        print("\n" + "=" * 80)
-        print(f"⚡ {title}")
-        print("=" * 80)
 
-    def setup_match3_physics_materials(self):
-        """Setup physics materials for match-3 game"""
-        print("🧱 Setting up Match-3 physics materials...")
+def _pack_layer_masks(layers, layer_collisions):
+    """Pack the collision graph into one 32-bit mask per layer"""
+    layer_masks = {name: 0 for name in layers}
+    for layer, peers in layer_collisions.items():
+        for peer in peers:
+            layer_masks[layer] |= 1 << layers[peer]
+            layer_masks[peer] |= 1 << layers[layer]
+    return layer_masks
+
+
+_PHYSICS_MATERIALS = {
+    "tile_material": {
+        "name": "TileMaterial",
+        "dynamic_friction": 0.6,
+        "static_friction": 0.6,
+        "bounciness": 0.0,
+        "friction_combine": "Average",
+        "bounce_combine": "Average",
+    },
+    "board_material": {
+        "name": "BoardMaterial",
+        "dynamic_friction": 0.8,
+        "static_friction": 0.8,
+        "bounciness": 0.1,
+        "friction_combine": "Average",
+        "bounce_combine": "Average",
+    },
+    "wall_material": {
+        "name": "WallMaterial",
+        "dynamic_friction": 0.9,
+        "static_friction": 0.9,
+        "bounciness": 0.0,
+        "friction_combine": "Maximum",
+        "bounce_combine": "Minimum",
+    },
+    "ice_material": {
+        "name": "IceMaterial",
+        "dynamic_friction": 0.1,
+        "static_friction": 0.1,
+        "bounciness": 0.0,
+        "friction_combine": "Minimum",
+        "bounce_combine": "Average",
+    },
+    "bouncy_material": {
+        "name": "BouncyMaterial",
+        "dynamic_friction": 0.4,
+        "static_friction": 0.4,
+        "bounciness": 0.8,
+        "friction_combine": "Average",
+        "bounce_combine": "Maximum",
+    },
+}
 
-        # Create match-3 specific physics materials
-        physics_materials = {
-            "tile_material": {
-                "name": "TileMaterial",
-                "dynamic_friction": 0.6,
-                "static_friction": 0.6,
-                "bounciness": 0.0,
-                "friction_combine": "Average",
-                "bounce_combine": "Average",
-            },
-            "board_material": {
-                "name": "BoardMaterial",
-                "dynamic_friction": 0.8,
-                "static_friction": 0.8,
-                "bounciness": 0.1,
-                "friction_combine": "Average",
-                "bounce_combine": "Average",
-            },
-            "wall_material": {
-                "name": "WallMaterial",
-                "dynamic_friction": 0.9,
-                "static_friction": 0.9,
-                "bounciness": 0.0,
-                "friction_combine": "Maximum",
-                "bounce_combine": "Minimum",
-            },
-            "ice_material": {
-                "name": "IceMaterial",
-                "dynamic_friction": 0.1,
-                "static_friction": 0.1,
-                "bounciness": 0.0,
-                "friction_combine": "Minimum",
-                "bounce_combine": "Average",
-            },
-            "bouncy_material": {
-                "name": "BouncyMaterial",
-                "dynamic_friction": 0.4,
-                "static_friction": 0.4,
-                "bounciness": 0.8,
-                "friction_combine": "Average",
-                "bounce_combine": "Maximum",
-            },
-        }
+# Unity serializes PhysicMaterialCombine as its enum value
+_MATERIAL_COMBINE = {"Average": 0, "Multiply": 1, "Minimum": 2, "Maximum": 3}
+
+_PHYSIC_MATERIAL_TEMPLATE = """%YAML 1.1
+%TAG !u! tag:unity3d.com,2011:
+--- !u!134 &13400000
+PhysicMaterial:
+  m_ObjectHideFlags: 0
+  m_CorrespondingSourceObject: {{fileID: 0}}
+  m_PrefabInstance: {{fileID: 0}}
+  m_PrefabAsset: {{fileID: 0}}
+  m_Name: {name}
+  dynamicFriction: {dynamic_friction}
+  staticFriction: {static_friction}
+  bounciness: {bounciness}
+  frictionCombine: {friction_combine}
+  bounceCombine: {bounce_combine}
+"""
 
-        # Save physics materials configuration
-        materials_file = self.materials_dir / "Match3PhysicsMaterials.json"
-        self.materials_dir.mkdir(parents=True, exist_ok=True)
+_PHYSICS_MATERIAL_2D_TEMPLATE = """%YAML 1.1
+%TAG !u! tag:unity3d.com,2011:
+--- !u!62 &6200000
+PhysicsMaterial2D:
+  m_ObjectHideFlags: 0
+  m_CorrespondingSourceObject: {{fileID: 0}}
+  m_PrefabInstance: {{fileID: 0}}
+  m_PrefabAsset: {{fileID: 0}}
+  m_Name: {name}
+  friction: {friction}
+  bounciness: {bounciness}
+"""
 
-        with open(materials_file, "w") as f:
-            json.dump(physics_materials, f, indent=2)
+_NATIVE_META_TEMPLATE = """fileFormatVersion: 2
+guid: {guid}
+NativeFormatImporter:
+  externalObjects: {{}}
+  mainObjectFileID: {file_id}
+  userData:
+  assetBundleName:
+  assetBundleVariant:
+"""
 
-        print(f"✅ Match-3 physics materials configured: {materials_file}")
-        return True
+_COLLISION_LAYERS = {
+    "layers": {
+        "Default": 0,
+        "TransparentFX": 1,
+        "Ignore Raycast": 2,
+        "Water": 4,
+        "UI": 5,
+        "Tile": 8,
+        "Board": 9,
+        "Wall": 10,
+        "PowerUp": 11,
+        "Particle": 12,
+        "Background": 13,
+        "Foreground": 14,
+    },
+    "layer_collisions": {
+        "Tile": ["Board", "Wall", "PowerUp"],
+        "Board": ["Tile", "Wall"],
+        "Wall": ["Tile", "Board"],
+        "PowerUp": ["Tile"],
+        "Particle": ["Default"],
+        "Background": [],
+        "Foreground": ["UI"],
+    },
+    "physics_settings": {
+        "gravity": [0, -9.81, 0],
+        "default_material": "TileMaterial",
+        "bounce_threshold": 2.0,
+        "sleep_threshold": 0.005,
+        "default_solver_iterations": 6,
+        "default_solver_velocity_iterations": 1,
+        "queries_hit_triggers": True,
+        "queries_start_in_colliders": False,
+    },
+}
 
-    def setup_collision_layers(self):
-        """Setup collision layers for match-3 game"""
-        print("🔗 Setting up collision layers...")
-
-        # Create collision layer configuration
-        collision_layers = {
-            "layers": {
-                "Default": 0,
-                "TransparentFX": 1,
-                "Ignore Raycast": 2,
-                "Water": 4,
-                "UI": 5,
-                "Tile": 8,
-                "Board": 9,
-                "Wall": 10,
-                "PowerUp": 11,
-                "Particle": 12,
-                "Background": 13,
-                "Foreground": 14,
-            },
-            "layer_collisions": {
-                "Tile": ["Board", "Wall", "PowerUp"],
-                "Board": ["Tile", "Wall"],
-                "Wall": ["Tile", "Board"],
-                "PowerUp": ["Tile"],
-                "Particle": ["Default"],
-                "Background": [],
-                "Foreground": ["UI"],
-            },
-            "physics_settings": {
-                "gravity": [0, -9.81, 0],
-                "default_material": "TileMaterial",
-                "bounce_threshold": 2.0,
-                "sleep_threshold": 0.005,
-                "default_solver_iterations": 6,
-                "default_solver_velocity_iterations": 1,
-                "queries_hit_triggers": True,
-                "queries_start_in_colliders": False,
-            },
-        }
+# Unity programs the layer matrix with a single bit test per pair
+_COLLISION_LAYERS["layer_masks"] = _pack_layer_masks(
+    _COLLISION_LAYERS["layers"], _COLLISION_LAYERS["layer_collisions"]
+)
+
+# Match-3 tiles live on a flat board, so every prefab uses the 2D physics
+# pipeline to match ``enable_physics_2d`` in the optimization settings.
+_PHYSICS_COMPONENTS = {
+    "tile_physics": {
+        "rigidbody": {
+            "mass": 1.0,
+            "drag": 0.0,
+            "angular_drag": 0.05,
+            "use_gravity": False,
+            "is_kinematic": True,
+            "interpolation": "None",
+            "collision_detection": "Discrete",
+        },
+        "collider": {
+            "type": "BoxCollider2D",
+            "is_trigger": False,
+            "material": "TileMaterial",
+            "size": [1.0, 1.0],
+            "center": [0, 0],
+        },
+    },
+    "board_physics": {
+        "rigidbody": {
+            "mass": 0.0,
+            "drag": 0.0,
+            "angular_drag": 0.05,
+            "use_gravity": False,
+            "is_kinematic": True,
+            "interpolation": "None",
+            "collision_detection": "Discrete",
+        },
+        "collider": {
+            "type": "BoxCollider2D",
+            "is_trigger": False,
+            "material": "BoardMaterial",
+            "size": [10.0, 0.1],
+            "center": [0, -0.5],
+        },
+    },
+    "wall_physics": {
+        "rigidbody": {
+            "mass": 0.0,
+            "drag": 0.0,
+            "angular_drag": 0.05,
+            "use_gravity": False,
+            "is_kinematic": True,
+            "interpolation": "None",
+            "collision_detection": "Discrete",
+        },
+        "collider": {
+            "type": "BoxCollider2D",
+            "is_trigger": False,
+            "material": "WallMaterial",
+            "size": [0.2, 10.0],
+            "center": [0, 0],
+        },
+    },
+    "powerup_physics": {
+        "rigidbody": {
+            "mass": 0.5,
+            "drag": 0.5,
+            "angular_drag": 0.1,
+            "use_gravity": True,
+            "is_kinematic": False,
+            "interpolation": "Interpolate",
+            "collision_detection": "Discrete",
+        },
+        "collider": {
+            "type": "CircleCollider2D",
+            "is_trigger": True,
+            "material": "BouncyMaterial",
+            "radius": 0.5,
+            "center": [0, 0],
+        },
+    },
+}
 
-        # Save collision layers configuration
-        layers_file = self.physics_dir / "CollisionLayers.json"
+_PHYSICS_OPTIMIZATION = {
+    "performance_settings": {
+        "enable_physics_2d": True,
+        "enable_physics_3d": False,
+        "enable_continuous_collision_detection": False,
+        "enable_queries_hit_triggers": True,
+        "enable_queries_start_in_colliders": False,
+    },
+    "collision_detection": {
+        "default_collision_detection": "Discrete",
+        "default_solver_iterations": 6,
+        "default_solver_velocity_iterations": 1,
+        "bounce_threshold": 2.0,
+        "sleep_threshold": 0.005,
+        "max_angular_velocity": 7.0,
+    },
+    "memory_management": {
+        "enable_physics_pooling": True,
+        "max_rigidbody_pool_size": 100,
+        "max_collider_pool_size": 200,
+        "physics_garbage_collection_interval": 30.0,
+    },
+    "quality_settings": {
+        "low": {
+            "solver_iterations": 4,
+            "solver_velocity_iterations": 1,
+            "bounce_threshold": 3.0,
+            "sleep_threshold": 0.01,
+        },
+        "medium": {
+            "solver_iterations": 6,
+            "solver_velocity_iterations": 1,
+            "bounce_threshold": 2.0,
+            "sleep_threshold": 0.005,
+        },
+        "high": {
+            "solver_iterations": 8,
+            "solver_velocity_iterations": 2,
+            "bounce_threshold": 1.0,
+            "sleep_threshold": 0.001,
+        },
+    },
+}
 
-        with open(layers_file, "w") as f:
-            json.dump(collision_layers, f, indent=2)
+# Everything the editor script needs, so Unity reads and parses one file
+_MATCH3_PHYSICS = {
+    "materials": _PHYSICS_MATERIALS,
+    "layers": _COLLISION_LAYERS,
+    "components": _PHYSICS_COMPONENTS,
+    "optimization": _PHYSICS_OPTIMIZATION,
+}
 
-        print(f"✅ Collision layers configured: {layers_file}")
-        return True
 
-    def setup_match3_physics_components(self):
-        """Setup physics components for match-3 game"""
-        print("🎮 Setting up Match-3 physics components...")
-
-        # Create physics components configuration
-        physics_components = {
-            "tile_physics": {
-                "rigidbody": {
-                    "mass": 1.0,
-                    "drag": 0.0,
-                    "angular_drag": 0.05,
-                    "use_gravity": False,
-                    "is_kinematic": True,
-                    "interpolation": "None",
-                    "collision_detection": "Discrete",
-                },
-                "collider": {
-                    "type": "BoxCollider",
-                    "is_trigger": False,
-                    "material": "TileMaterial",
-                    "size": [1.0, 1.0, 1.0],
-                    "center": [0, 0, 0],
-                },
-            },
-            "board_physics": {
-                "rigidbody": {
-                    "mass": 0.0,
-                    "drag": 0.0,
-                    "angular_drag": 0.05,
-                    "use_gravity": False,
-                    "is_kinematic": True,
-                    "interpolation": "None",
-                    "collision_detection": "Discrete",
-                },
-                "collider": {
-                    "type": "BoxCollider",
-                    "is_trigger": False,
-                    "material": "BoardMaterial",
-                    "size": [10.0, 0.1, 10.0],
-                    "center": [0, -0.5, 0],
-                },
-            },
-            "wall_physics": {
-                "rigidbody": {
-                    "mass": 0.0,
-                    "drag": 0.0,
-                    "angular_drag": 0.05,
-                    "use_gravity": False,
-                    "is_kinematic": True,
-                    "interpolation": "None",
-                    "collision_detection": "Discrete",
-                },
-                "collider": {
-                    "type": "BoxCollider",
-                    "is_trigger": False,
-                    "material": "WallMaterial",
-                    "size": [0.2, 10.0, 10.0],
-                    "center": [0, 0, 0],
-                },
-            },
-            "powerup_physics": {
-                "rigidbody": {
-                    "mass": 0.5,
-                    "drag": 0.5,
-                    "angular_drag": 0.1,
-                    "use_gravity": True,
-                    "is_kinematic": False,
-                    "interpolation": "Interpolate",
-                    "collision_detection": "Continuous",
-                },
-                "collider": {
-                    "type": "SphereCollider",
-                    "is_trigger": True,
-                    "material": "BouncyMaterial",
-                    "radius": 0.5,
-                    "center": [0, 0, 0],
-                },
-            },
-        }
+def _atomic_write_bytes(path, data):
+    """Write bytes to path with raw os calls, replacing the file atomically"""
+    tmp_path = f"{path}.tmp"
+    flags = (
+        os.O_WRONLY
+        | os.O_CREAT
+        | os.O_TRUNC
+        | getattr(os, "O_BINARY", 0)
+        | getattr(os, "O_CLOEXEC", 0)
+    )
+    fd = os.open(tmp_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
-        # Save physics components configuration
-        components_file = self.physics_dir / "Match3PhysicsComponents.json"
 
-        with open(components_file, "w") as f:
-            json.dump(physics_components, f, indent=2)
+def _encode_json(config):
+    """Encode config as indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
 
-        print(f"✅ Match-3 physics components configured: {components_file}")
-        return True
 
-    def setup_physics_optimization(self):
-        """Setup physics optimization for match-3 game"""
-        print("🚀 Setting up physics optimization...")
-
-        # Create physics optimization configuration
-        physics_optimization = {
-            "performance_settings": {
-                "enable_physics_2d": True,
-                "enable_physics_3d": False,
-                "enable_continuous_collision_detection": False,
-                "enable_queries_hit_triggers": True,
-                "enable_queries_start_in_colliders": False,
-            },
-            "collision_detection": {
-                "default_collision_detection": "Discrete",
-                "default_solver_iterations": 6,
-                "default_solver_velocity_iterations": 1,
-                "bounce_threshold": 2.0,
-                "sleep_threshold": 0.005,
-                "max_angular_velocity": 7.0,
-            },
-            "memory_management": {
-                "enable_physics_pooling": True,
-                "max_rigidbody_pool_size": 100,
-                "max_collider_pool_size": 200,
-                "physics_garbage_collection_interval": 30.0,
-            },
-            "quality_settings": {
-                "low": {
-                    "solver_iterations": 4,
-                    "solver_velocity_iterations": 1,
-                    "bounce_threshold": 3.0,
-                    "sleep_threshold": 0.01,
-                },
-                "medium": {
-                    "solver_iterations": 6,
-                    "solver_velocity_iterations": 1,
-                    "bounce_threshold": 2.0,
-                    "sleep_threshold": 0.005,
-                },
-                "high": {
-                    "solver_iterations": 8,
-                    "solver_velocity_iterations": 2,
-                    "bounce_threshold": 1.0,
-                    "sleep_threshold": 0.001,
-                },
-            },
-        }
+def _write_json(path, config):
+    """Encode config once and write it in a single shot"""
+    _atomic_write_bytes(path, _encode_json(config))
 
-        # Save physics optimization configuration
-        optimization_file = self.physics_dir / "PhysicsOptimization.json"
 
-        with open(optimization_file, "w") as f:
-            json.dump(physics_optimization, f, indent=2)
+class Match3PhysicsAutomation:
+    __slots__ = ("repo_root", "unity_assets", "physics_dir", "materials_dir")
+
+    def __init__(self):
+        self.repo_root = Path(__file__).parent.parent.parent
+        self.unity_assets = self.repo_root / "unity" / "Assets"
+        self.physics_dir = self.unity_assets / "Physics"
+        self.materials_dir = self.physics_dir / "Materials"
 
-        print(f"✅ Physics optimization configured: {optimization_file}")
+    def setup_match3_physics_materials(self):
+        """Setup physics materials for match-3 game"""
+        print("🧱 Setting up Match-3 physics materials...")
+
+        self.materials_dir.mkdir(parents=True, exist_ok=True)
+
+        # Write the material assets directly so Unity only has to import them
+        for material in _PHYSICS_MATERIALS.values():
+            self._write_material_asset(material)
+
+        print(f"✅ Match-3 physics materials configured: {self.materials_dir}")
+        return True
+
+    def _write_material_asset(self, material):
+        """Write 3D and 2D physics material assets with stable GUIDs"""
+        name = material["name"]
+        assets = (
+            (
+                f"{name}.physicMaterial",
+                _PHYSIC_MATERIAL_TEMPLATE.format(
+                    name=name,
+                    dynamic_friction=material["dynamic_friction"],
+                    static_friction=material["static_friction"],
+                    bounciness=material["bounciness"],
+                    friction_combine=_MATERIAL_COMBINE[material["friction_combine"]],
+                    bounce_combine=_MATERIAL_COMBINE[material["bounce_combine"]],
+                ),
+                13400000,
+            ),
+            (
+                f"{name}.physicsMaterial2D",
+                _PHYSICS_MATERIAL_2D_TEMPLATE.format(
+                    name=name,
+                    friction=material["dynamic_friction"],
+                    bounciness=material["bounciness"],
+                ),
+                6200000,
+            ),
+        )
+
+        for file_name, content, file_id in assets:
+            guid = hashlib.md5(file_name.encode("utf-8")).hexdigest()
+            asset_path = self.materials_dir / file_name
+            meta = _NATIVE_META_TEMPLATE.format(guid=guid, file_id=file_id)
+            _atomic_write_bytes(asset_path, content.encode("utf-8"))
+            _atomic_write_bytes(f"{asset_path}.meta", meta.encode("utf-8"))
+
+    def setup_combined_physics_config(self):
+        """Setup the combined physics config read by the Unity Editor script"""
+        print("📦 Setting up combined physics configuration...")
+
+        # Save combined physics configuration
+        combined_file = self.physics_dir / "Match3Physics.json"
+
+        _write_json(combined_file, _MATCH3_PHYSICS)
+
+        print(f"✅ Combined physics configuration saved: {combined_file}")
         return True
 
     def create_physics_automation_script(self):
@@ -331,27 +461,38 @@ namespace Evergreen.Editor
             }
         }
 
+        private const string ConfigPath = "Assets/Physics/Match3Physics.json";
+
+        private static Match3PhysicsConfig cachedConfig;
+
+        private static Match3PhysicsConfig LoadConfig()
+        {
+            // Read and parse the combined config once, then serve it from memory
+            if (cachedConfig == null && File.Exists(ConfigPath))
+            {
+                cachedConfig = JsonUtility.FromJson<Match3PhysicsConfig>(File.ReadAllText(ConfigPath));
+            }
+
+            return cachedConfig;
+        }
+
         private static void SetupPhysicsMaterials()
         {
             try
             {
                 Debug.Log("🧱 Setting up Physics Materials...");
 
-                // Load physics materials configuration
-                string configPath = "Assets/Physics/Materials/Match3PhysicsMaterials.json";
-                if (File.Exists(configPath))
+                // Materials are pre-serialized by match3_physics_automation.py, so just import them
+                string materialsFolder = "Assets/Physics/Materials";
+                if (AssetDatabase.IsValidFolder(materialsFolder))
                 {
-                    string json = File.ReadAllText(configPath);
-                    var config = JsonUtility.FromJson<PhysicsMaterialsConfig>(json);
-
-                    // Create physics materials
-                    CreatePhysicsMaterials(config.physics_materials);
+                    AssetDatabase.ImportAsset(materialsFolder, ImportAssetOptions.ImportRecursive);
 
                     Debug.Log("✅ Physics Materials setup completed!");
                 }
                 else
                 {
-                    Debug.LogWarning("⚠️ Match3PhysicsMaterials.json not found");
+                    Debug.LogWarning("⚠️ Physics materials folder not found");
                 }
             }
             catch (System.Exception e)
@@ -360,50 +501,61 @@ namespace Evergreen.Editor
             }
         }
 
-        private static void CreatePhysicsMaterials(Dictionary<string, PhysicsMaterialData> materials)
-        {
-            foreach (var kvp in materials)
+        private static readonly Dictionary<string, RigidbodyInterpolation> Interpolations =
+            new Dictionary<string, RigidbodyInterpolation>(System.StringComparer.OrdinalIgnoreCase)
             {
-                var materialName = kvp.Key;
-                var materialData = kvp.Value;
+                { "none", RigidbodyInterpolation.None },
+                { "interpolate", RigidbodyInterpolation.Interpolate },
+                { "extrapolate", RigidbodyInterpolation.Extrapolate },
+            };
 
-                Debug.Log($"🧱 Creating physics material: {materialName}");
+        private static readonly Dictionary<string, CollisionDetectionMode> CollisionDetectionModes =
+            new Dictionary<string, CollisionDetectionMode>(System.StringComparer.OrdinalIgnoreCase)
+            {
+                { "discrete", CollisionDetectionMode.Discrete },
+                { "continuous", CollisionDetectionMode.Continuous },
+                { "continuousdynamic", CollisionDetectionMode.ContinuousDynamic },
+                { "continuousspeculative", CollisionDetectionMode.ContinuousSpeculative },
+            };
+
+        private static readonly Dictionary<string, RigidbodyInterpolation2D> Interpolations2D =
+            new Dictionary<string, RigidbodyInterpolation2D>(System.StringComparer.OrdinalIgnoreCase)
+            {
+                { "none", RigidbodyInterpolation2D.None },
+                { "interpolate", RigidbodyInterpolation2D.Interpolate },
+                { "extrapolate", RigidbodyInterpolation2D.Extrapolate },
+            };
 
-                // Create physics material
-                var material = new PhysicMaterial(materialName);
-                material.dynamicFriction = materialData.dynamic_friction;
-                material.staticFriction = materialData.static_friction;
-                material.bounciness = materialData.bounciness;
-                material.frictionCombine = GetFrictionCombine(materialData.friction_combine);
-                material.bounceCombine = GetBounceCombine(materialData.bounce_combine);
+        private static readonly Dictionary<string, CollisionDetectionMode2D> CollisionDetectionModes2D =
+            new Dictionary<string, CollisionDetectionMode2D>(System.StringComparer.OrdinalIgnoreCase)
+            {
+                { "discrete", CollisionDetectionMode2D.Discrete },
+                { "continuous", CollisionDetectionMode2D.Continuous },
+            };
 
-                // Save physics material
-                AssetDatabase.CreateAsset(material, $"Assets/Physics/Materials/{materialName}.physicMaterial");
-            }
+        private enum ColliderShape
+        {
+            None,
+            Box,
+            Sphere,
+            Box2D,
+            Circle2D,
         }
 
-        private static PhysicMaterialCombine GetFrictionCombine(string combine)
-        {
-            switch (combine.ToLower())
+        private static readonly Dictionary<string, ColliderShape> ColliderShapes =
+            new Dictionary<string, ColliderShape>(System.StringComparer.OrdinalIgnoreCase)
             {
-                case "average": return PhysicMaterialCombine.Average;
-                case "minimum": return PhysicMaterialCombine.Minimum;
-                case "maximum": return PhysicMaterialCombine.Maximum;
-                case "multiply": return PhysicMaterialCombine.Multiply;
-                default: return PhysicMaterialCombine.Average;
-            }
-        }
+                { "boxcollider", ColliderShape.Box },
+                { "spherecollider", ColliderShape.Sphere },
+                { "boxcollider2d", ColliderShape.Box2D },
+                { "circlecollider2d", ColliderShape.Circle2D },
+            };
 
-        private static PhysicMaterialCombine GetBounceCombine(string combine)
+        private static ColliderShape GetColliderShape(string type)
         {
-            switch (combine.ToLower())
-            {
-                case "average": return PhysicMaterialCombine.Average;
-                case "minimum": return PhysicMaterialCombine.Minimum;
-                case "maximum": return PhysicMaterialCombine.Maximum;
-                case "multiply": return PhysicMaterialCombine.Multiply;
-                default: return PhysicMaterialCombine.Average;
-            }
+            return type != null && ColliderShapes.TryGetValue(type, out var value)
+                ? value
+                : ColliderShape.None;
         }
 
         private static void SetupCollisionLayers()
@@ -412,21 +564,21 @@ namespace Evergreen.Editor
             {
                 Debug.Log("🔗 Setting up Collision Layers...");
 
-                // Load collision layers configuration
-                string configPath = "Assets/Physics/CollisionLayers.json";
-                if (File.Exists(configPath))
+                // Load physics configuration
+                var config = LoadConfig();
+                if (config != null)
                 {
-                    string json = File.ReadAllText(configPath);
-                    var config = JsonUtility.FromJson<CollisionLayersConfig>(json);
-
                     // Apply physics settings
-                    ApplyPhysicsSettings(config.physics_settings);
+                    ApplyPhysicsSettings(config.layers.physics_settings);
+
+                    // Apply layer collision matrix
+                    ApplyLayerMatrix(config.layers.layers, config.layers.layer_masks);
 
                     Debug.Log("✅ Collision Layers setup completed!");
                 }
                 else
                 {
-                    Debug.LogWarning("⚠️ CollisionLayers.json not found");
+                    Debug.LogWarning("⚠️ Match3Physics.json not found");
                 }
             }
             catch (System.Exception e)
@@ -435,6 +587,22 @@ namespace Evergreen.Editor
             }
         }
 
+        private static void ApplyLayerMatrix(Dictionary<string, int> layerIndex, Dictionary<string, int> masks)
+        {
+            // One pass over the configured layers with a single bit test per pair
+            foreach (var kvp in layerIndex)
+            {
+                int i = kvp.Value;
+                int mask = masks.TryGetValue(kvp.Key, out var value) ? value : 0;
+                for (int j = 0; j < 32; j++)
+                {
+                    Physics2D.IgnoreLayerCollision(i, j, ((mask >> j) & 1) == 0);
+                }
+            }
+
+            Debug.Log("🔗 Layer collision matrix applied");
+        }
+
         private static void ApplyPhysicsSettings(PhysicsSettings settings)
         {
             // Apply gravity
@@ -461,21 +629,18 @@ namespace Evergreen.Editor
             {
                 Debug.Log("🎮 Setting up Physics Components...");
 
-                // Load physics components configuration
-                string configPath = "Assets/Physics/Match3PhysicsComponents.json";
-                if (File.Exists(configPath))
+                // Load physics configuration
+                var config = LoadConfig();
+                if (config != null)
                 {
-                    string json = File.ReadAllText(configPath);
-                    var config = JsonUtility.FromJson<PhysicsComponentsConfig>(json);
-
                     // Create physics component prefabs
-                    CreatePhysicsComponentPrefabs(config);
+                    CreatePhysicsComponentPrefabs(config.components);
 
                     Debug.Log("✅ Physics Components setup completed!");
                 }
                 else
                 {
-                    Debug.LogWarning("⚠️ Match3PhysicsComponents.json not found");
+                    Debug.LogWarning("⚠️ Match3Physics.json not found");
                 }
             }
             catch (System.Exception e)
@@ -506,6 +671,72 @@ namespace Evergreen.Editor
             // Create GameObject
             var obj = new GameObject(prefabName);
 
+            var shape = GetColliderShape(componentData.collider.type);
+            if (shape == ColliderShape.Box2D || shape == ColliderShape.Circle2D)
+            {
+                AddPhysics2DComponents(obj, componentData, shape);
+            }
+            else
+            {
+                AddPhysics3DComponents(obj, componentData, shape);
+            }
+
+            // Save as prefab
+            PrefabUtility.SaveAsPrefabAsset(obj, $"Assets/Prefabs/Physics/{prefabName}.prefab");
+            DestroyImmediate(obj);
+        }
+
+        private static void AddPhysics2DComponents(GameObject obj, PhysicsComponentData componentData, ColliderShape shape)
+        {
+            // Add Rigidbody2D
+            var rigidbody = obj.AddComponent<Rigidbody2D>();
+            rigidbody.mass = componentData.rigidbody.mass;
+            rigidbody.drag = componentData.rigidbody.drag;
+            rigidbody.angularDrag = componentData.rigidbody.angular_drag;
+            rigidbody.gravityScale = componentData.rigidbody.use_gravity ? 1f : 0f;
+            rigidbody.isKinematic = componentData.rigidbody.is_kinematic;
+            rigidbody.interpolation = GetRigidbodyInterpolation2D(componentData.rigidbody.interpolation);
+            rigidbody.collisionDetectionMode = GetCollisionDetectionMode2D(componentData.rigidbody.collision_detection);
+
+            // Add Collider2D
+            Collider2D collider = null;
+            var offset = new Vector2(
+                componentData.collider.center[0],
+                componentData.collider.center[1]
+            );
+            switch (shape)
+            {
+                case ColliderShape.Box2D:
+                    var boxCollider = obj.AddComponent<BoxCollider2D>();
+                    boxCollider.size = new Vector2(
+                        componentData.collider.size[0],
+                        componentData.collider.size[1]
+                    );
+                    collider = boxCollider;
+                    break;
+                case ColliderShape.Circle2D:
+                    var circleCollider = obj.AddComponent<CircleCollider2D>();
+                    circleCollider.radius = componentData.collider.radius;
+                    collider = circleCollider;
+                    break;
+            }
+
+            if (collider != null)
+            {
+                collider.offset = offset;
+                collider.isTrigger = componentData.collider.is_trigger;
+
+                // Load physics material
+                var material = AssetDatabase.LoadAssetAtPath<PhysicsMaterial2D>($"Assets/Physics/Materials/{componentData.collider.material}.physicsMaterial2D");
+                if (material != null)
+                {
+                    collider.sharedMaterial = material;
+                }
+            }
+        }
+
+        private static void AddPhysics3DComponents(GameObject obj, PhysicsComponentData componentData, ColliderShape shape)
+        {
             // Add Rigidbody
             var rigidbody = obj.AddComponent<Rigidbody>();
             rigidbody.mass = componentData.rigidbody.mass;
@@ -518,9 +749,9 @@ namespace Evergreen.Editor
 
             // Add Collider
             Collider collider = null;
-            switch (componentData.collider.type.ToLower())
+            switch (shape)
             {
-                case "boxcollider":
+                case ColliderShape.Box:
                     var boxCollider = obj.AddComponent<BoxCollider>();
                     boxCollider.size = new Vector3(
                         componentData.collider.size[0],
@@ -534,7 +765,7 @@ namespace Evergreen.Editor
                     );
                     collider = boxCollider;
                     break;
-                case "spherecollider":
+                case ColliderShape.Sphere:
                     var sphereCollider = obj.AddComponent<SphereCollider>();
                     sphereCollider.radius = componentData.collider.radius;
                     sphereCollider.center = new Vector3(
@@ -557,33 +788,34 @@ namespace Evergreen.Editor
                     collider.material = material;
                 }
             }
-
-            // Save as prefab
-            PrefabUtility.SaveAsPrefabAsset(obj, $"Assets/Prefabs/Physics/{prefabName}.prefab");
-            DestroyImmediate(obj);
         }
 
         private static RigidbodyInterpolation GetRigidbodyInterpolation(string interpolation)
         {
-            switch (interpolation.ToLower())
-            {
-                case "none": return RigidbodyInterpolation.None;
-                case "interpolate": return RigidbodyInterpolation.Interpolate;
-                case "extrapolate": return RigidbodyInterpolation.Extrapolate;
-                default: return RigidbodyInterpolation.None;
-            }
+            return interpolation != null && Interpolations.TryGetValue(interpolation, out var value)
+                ? value
+                : RigidbodyInterpolation.None;
         }
 
         private static CollisionDetectionMode GetCollisionDetectionMode(string detection)
         {
-            switch (detection.ToLower())
-            {
-                case "discrete": return CollisionDetectionMode.Discrete;
-                case "continuous": return CollisionDetectionMode.Continuous;
-                case "continuousdynamic": return CollisionDetectionMode.ContinuousDynamic;
-                case "continuousspeculative": return CollisionDetectionMode.ContinuousSpeculative;
-                default: return CollisionDetectionMode.Discrete;
-            }
+            return detection != null && CollisionDetectionModes.TryGetValue(detection, out var value)
+                ? value
+                : CollisionDetectionMode.Discrete;
+        }
+
+        private static RigidbodyInterpolation2D GetRigidbodyInterpolation2D(string interpolation)
+        {
+            return interpolation != null && Interpolations2D.TryGetValue(interpolation, out var value)
+                ? value
+                : RigidbodyInterpolation2D.None;
+        }
+
+        private static CollisionDetectionMode2D GetCollisionDetectionMode2D(string detection)
+        {
+            return detection != null && CollisionDetectionModes2D.TryGetValue(detection, out var value)
+                ? value
+                : CollisionDetectionMode2D.Discrete;
         }
 
         private static void OptimizePhysics()
@@ -592,27 +824,24 @@ namespace Evergreen.Editor
             {
                 Debug.Log("🚀 Optimizing Physics...");
 
-                // Load physics optimization configuration
-                string configPath = "Assets/Physics/PhysicsOptimization.json";
-                if (File.Exists(configPath))
+                // Load physics configuration
+                var config = LoadConfig();
+                if (config != null)
                 {
-                    string json = File.ReadAllText(configPath);
-                    var config = JsonUtility.FromJson<PhysicsOptimizationConfig>(json);
-
                     // Apply performance settings
-                    ApplyPerformanceSettings(config.performance_settings);
+                    ApplyPerformanceSettings(config.optimization.performance_settings);
 
                     // Apply collision detection settings
-                    ApplyCollisionDetectionSettings(config.collision_detection);
+                    ApplyCollisionDetectionSettings(config.optimization.collision_detection);
 
                     // Setup memory management
-                    SetupMemoryManagement(config.memory_management);
+                    SetupMemoryManagement(config.optimization.memory_management);
 
                     Debug.Log("✅ Physics optimization completed!");
                 }
                 else
                 {
-                    Debug.LogWarning("⚠️ PhysicsOptimization.json not found");
+                    Debug.LogWarning("⚠️ Match3Physics.json not found");
                 }
             }
             catch (System.Exception e)
@@ -633,6 +862,9 @@ namespace Evergreen.Editor
                 Debug.Log("🚀 Physics 3D enabled");
             }
 
+            // Skip the 3D solver step entirely when only 2D physics is in use
+            Physics.autoSimulation = settings.enable_physics_3d;
+
             Debug.Log("🚀 Performance settings applied");
         }
 
@@ -663,6 +895,9 @@ namespace Evergreen.Editor
             {
                 Debug.Log("🎯 Running full Match-3 physics automation...");
 
+                // Pick up any config regenerated since the last run
+                cachedConfig = null;
+
                 SetupPhysicsMaterials();
                 SetupCollisionLayers();
                 SetupPhysicsComponents();
@@ -679,9 +914,12 @@ namespace Evergreen.Editor
 
     // Data structures for JSON deserialization
     [System.Serializable]
-    public class PhysicsMaterialsConfig
+    public class Match3PhysicsConfig
     {
-        public Dictionary<string, PhysicsMaterialData> physics_materials;
+        public Dictionary<string, PhysicsMaterialData> materials;
+        public CollisionLayersConfig layers;
+        public PhysicsComponentsConfig components;
+        public PhysicsOptimizationConfig optimization;
     }
 
     [System.Serializable]
@@ -700,6 +938,7 @@ namespace Evergreen.Editor
     {
         public Dictionary<string, int> layers;
         public Dictionary<string, string[]> layer_collisions;
+        public Dictionary<string, int> layer_masks;
         public PhysicsSettings physics_settings;
     }
 
@@ -809,42 +1048,44 @@ namespace Evergreen.Editor
         script_path = self.unity_assets / "Editor" / "Match3PhysicsAutomation.cs"
         script_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(script_path, "w") as f:
-            f.write(script_content)
+        # Skip the write when nothing changed so Unity does not recompile
+        new_content = script_content.encode("utf-8")
+        try:
+            old_content = script_path.read_bytes()
+        except FileNotFoundError:
+            old_content = None
+
+        if old_content == new_content:
+            print(f"✅ Match-3 physics automation script unchanged: {script_path}")
+            return True
+
+        # Hand the whole script to the OS in a single write
+        _atomic_write_bytes(script_path, new_content)
 
         print(f"✅ Match-3 physics automation script created: {script_path}")
         return True
 
     def run_full_automation(self):
         """Run complete match-3 physics automation"""
-        self.print_header("Match-3 Physics Full Automation")
+        sys.stdout.write(_INTRO_BANNER)
 
-        print("🎯 This will automate Match-3 specific physics setup")
-        print("   - Physics Materials (tile, board, wall, ice, bouncy)")
-        print("   - Collision Layers (tile, board, wall, powerup, particle)")
-        print("   - Physics Components (rigidbody, collider configurations)")
-        print("   - Physics Optimization (performance, memory management)")
-        print("   - Physics Prefabs generation")
+        steps = [
+            self.setup_match3_physics_materials,
+            self.setup_combined_physics_config,
+            self.create_physics_automation_script,
+        ]
 
         success = True
 
-        # Run all automation steps
-        success &= self.setup_match3_physics_materials()
-        success &= self.setup_collision_layers()
-        success &= self.setup_match3_physics_components()
-        success &= self.setup_physics_optimization()
-        success &= self.create_physics_automation_script()
-
-        if success:
-            print("\n🎉 Match-3 physics automation completed successfully!")
-            print("✅ Physics Materials configured")
-            print("✅ Collision Layers setup")
-            print("✅ Physics Components configured")
-            print("✅ Physics Optimization applied")
-            print("✅ Physics Prefabs generated")
-            print("✅ Unity Editor automation script created")
-        else:
-            print("\n⚠️ Some Match-3 physics automation steps failed")
+        # Run all automation steps, stopping at the first failure
+        for step in steps:
+            if not step():
+                success = False
+                break
+
+        # Emit the status block with a single write
+        sys.stdout.write(_SUCCESS_BANNER if success else _FAILURE_BANNER)
+        sys.stdout.flush()
 
         return success
 
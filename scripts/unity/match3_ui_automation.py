@@ -5,385 +5,276 @@ Automates UI setup specifically for Evergreen Puzzler match-3 game
 """
 
 import json
+import logging
 import os
-import subprocess
+import sys
 from pathlib import Path
 
-import yaml
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+logger = logging.getLogger(__name__)
 
-class Match3UIAutomation:
-    def __init__(self):
-        self.repo_root = Path(__file__).parent.parent.parent
-        self.unity_assets = self.repo_root / "unity" / "Assets"
-        self.ui_dir = self.unity_assets / "UI"
-        self.prefabs_dir = self.unity_assets / "Prefabs" / "UI"
+# Unity ignores JSON formatting, so only pretty-print when asked to
+_PRETTY_JSON = os.environ.get("UI_AUTOMATION_PRETTY") == "1"
 
-    def print_header(self, title):
-        """Print formatted header"""
-        print("\n" + "=" * 80)
-        print(f"🖥️ {title}")
-        print("=" * 80)
-
-    def setup_match3_ui_canvas(self):
-        """Setup UI Canvas for match-3 game"""
-        print("🎨 Setting up Match-3 UI Canvas...")
-
-        # Create UI Canvas configuration
-        ui_canvas_config = {
-            "main_canvas": {
-                "name": "MainCanvas",
-                "render_mode": "ScreenSpaceOverlay",
-                "sorting_order": 0,
-                "ui_scale_mode": "ScaleWithScreenSize",
-                "reference_resolution": [1920, 1080],
-                "screen_match_mode": "MatchWidthOrHeight",
-                "match_width_or_height": 0.5,
-                "canvas_scaler": {
-                    "ui_scale_mode": "ScaleWithScreenSize",
-                    "reference_resolution": [1920, 1080],
-                    "screen_match_mode": "MatchWidthOrHeight",
-                    "match_width_or_height": 0.5,
-                },
-            },
-            "gameplay_canvas": {
-                "name": "GameplayCanvas",
-                "render_mode": "ScreenSpaceOverlay",
-                "sorting_order": 1,
-                "ui_scale_mode": "ScaleWithScreenSize",
-                "reference_resolution": [1920, 1080],
-                "screen_match_mode": "MatchWidthOrHeight",
-                "match_width_or_height": 0.5,
-            },
-            "ui_canvas": {
-                "name": "UICanvas",
-                "render_mode": "ScreenSpaceOverlay",
-                "sorting_order": 2,
-                "ui_scale_mode": "ScaleWithScreenSize",
-                "reference_resolution": [1920, 1080],
-                "screen_match_mode": "MatchWidthOrHeight",
-                "match_width_or_height": 0.5,
-            },
-        }
-
-        # Save UI Canvas configuration
-        canvas_file = self.ui_dir / "Match3UICanvas.json"
-
-        with open(canvas_file, "w") as f:
-            json.dump(ui_canvas_config, f, indent=2)
+_HEADER_RULE = "=" * 80
 
-        print(f"✅ Match-3 UI Canvas configured: {canvas_file}")
-        return True
+_INTRO_BANNER = f"""
+{_HEADER_RULE}
+🖥️ Match-3 UI Full Automation
+{_HEADER_RULE}
+🎯 This will automate Match-3 specific UI setup
+   - UI Canvas configuration (Main, Gameplay, UI)
+   - UI Elements (Main Menu, Gameplay, Game Over, Level Complete)
+   - Responsive UI for different screen sizes
+   - UI Animations (buttons, text, panels)
+   - UI Prefabs generation
+"""
 
-    def setup_match3_ui_elements(self):
-        """Setup UI elements for match-3 game"""
-        print("🎮 Setting up Match-3 UI elements...")
-
-        # Create match-3 specific UI configuration
-        match3_ui = {
-            "main_menu": {
-                "elements": [
-                    {
-                        "name": "TitleText",
-                        "type": "Text",
-                        "text": "Evergreen Puzzler",
-                        "font_size": 72,
-                        "color": [1.0, 1.0, 1.0, 1.0],
-                        "position": [0, 200, 0],
-                        "size": [600, 100],
-                    },
-                    {
-                        "name": "PlayButton",
-                        "type": "Button",
-                        "text": "Play",
-                        "font_size": 36,
-                        "color": [0.2, 0.8, 0.2, 1.0],
-                        "position": [0, 0, 0],
-                        "size": [200, 80],
-                    },
-                    {
-                        "name": "SettingsButton",
-                        "type": "Button",
-                        "text": "Settings",
-                        "font_size": 36,
-                        "color": [0.2, 0.6, 0.8, 1.0],
-                        "position": [0, -100, 0],
-                        "size": [200, 80],
-                    },
-                    {
-                        "name": "QuitButton",
-                        "type": "Button",
-                        "text": "Quit",
-                        "font_size": 36,
-                        "color": [0.8, 0.2, 0.2, 1.0],
-                        "position": [0, -200, 0],
-                        "size": [200, 80],
-                    },
-                ]
-            },
-            "gameplay_ui": {
-                "elements": [
-                    {
-                        "name": "ScoreText",
-                        "type": "Text",
-                        "text": "Score: 0",
-                        "font_size": 48,
-                        "color": [1.0, 1.0, 1.0, 1.0],
-                        "position": [-400, 400, 0],
-                        "size": [300, 60],
-                    },
-                    {
-                        "name": "MovesText",
-                        "type": "Text",
-                        "text": "Moves: 20",
-                        "font_size": 36,
-                        "color": [1.0, 1.0, 1.0, 1.0],
-                        "position": [400, 400, 0],
-                        "size": [250, 50],
-                    },
-                    {
-                        "name": "LevelText",
-                        "type": "Text",
-                        "text": "Level 1",
-                        "font_size": 42,
-                        "color": [1.0, 1.0, 1.0, 1.0],
-                        "position": [0, 400, 0],
-                        "size": [200, 60],
-                    },
-                    {
-                        "name": "PauseButton",
-                        "type": "Button",
-                        "text": "Pause",
-                        "font_size": 24,
-                        "color": [0.8, 0.8, 0.2, 1.0],
-                        "position": [450, 450, 0],
-                        "size": [100, 50],
-                    },
-                ]
-            },
-            "game_over_ui": {
-                "elements": [
-                    {
-                        "name": "GameOverText",
-                        "type": "Text",
-                        "text": "Game Over",
-                        "font_size": 64,
-                        "color": [1.0, 0.2, 0.2, 1.0],
-                        "position": [0, 100, 0],
-                        "size": [400, 80],
-                    },
-                    {
-                        "name": "FinalScoreText",
-                        "type": "Text",
-                        "text": "Final Score: 0",
-                        "font_size": 36,
-                        "color": [1.0, 1.0, 1.0, 1.0],
-                        "position": [0, 0, 0],
-                        "size": [300, 50],
-                    },
-                    {
-                        "name": "RestartButton",
-                        "type": "Button",
-                        "text": "Restart",
-                        "font_size": 36,
-                        "color": [0.2, 0.8, 0.2, 1.0],
-                        "position": [0, -100, 0],
-                        "size": [200, 80],
-                    },
-                    {
-                        "name": "MainMenuButton",
-                        "type": "Button",
-                        "text": "Main Menu",
-                        "font_size": 36,
-                        "color": [0.2, 0.6, 0.8, 1.0],
-                        "position": [0, -200, 0],
-                        "size": [200, 80],
-                    },
-                ]
-            },
-            "level_complete_ui": {
-                "elements": [
-                    {
-                        "name": "LevelCompleteText",
-                        "type": "Text",
-                        "text": "Level Complete!",
-                        "font_size": 64,
-                        "color": [0.2, 1.0, 0.2, 1.0],
-                        "position": [0, 100, 0],
-                        "size": [500, 80],
-                    },
-                    {
-                        "name": "StarsText",
-                        "type": "Text",
-                        "text": "⭐⭐⭐",
-                        "font_size": 48,
-                        "color": [1.0, 1.0, 0.0, 1.0],
-                        "position": [0, 0, 0],
-                        "size": [300, 60],
-                    },
-                    {
-                        "name": "NextLevelButton",
-                        "type": "Button",
-                        "text": "Next Level",
-                        "font_size": 36,
-                        "color": [0.2, 0.8, 0.2, 1.0],
-                        "position": [0, -100, 0],
-                        "size": [200, 80],
-                    },
-                    {
-                        "name": "MainMenuButton",
-                        "type": "Button",
-                        "text": "Main Menu",
-                        "font_size": 36,
-                        "color": [0.2, 0.6, 0.8, 1.0],
-                        "position": [0, -200, 0],
-                        "size": [200, 80],
-                    },
-                ]
-            },
-        }
+_SUCCESS_BANNER = """
+🎉 Match-3 UI automation completed successfully!
+✅ UI Canvas configured
+✅ UI Elements setup
+✅ Responsive UI configured
+✅ UI Animations setup
+✅ UI Prefabs generated
+✅ Unity Editor automation script created
+"""
 
-        # Save UI elements configuration
-        ui_elements_file = self.ui_dir / "Match3UIElements.json"
+_FAILURE_BANNER = """
+⚠️ Some Match-3 UI automation steps failed
+"""
 
-        with open(ui_elements_file, "w") as f:
-            json.dump(match3_ui, f, indent=2)
+# Settings shared by every canvas; each canvas only adds its name and order
+_CANVAS_DEFAULTS = {
+    "render_mode": "ScreenSpaceOverlay",
+    "ui_scale_mode": "ScaleWithScreenSize",
+    "reference_resolution": [1920, 1080],
+    "screen_match_mode": "MatchWidthOrHeight",
+    "match_width_or_height": 0.5,
+}
 
-        print(f"✅ Match-3 UI elements configured: {ui_elements_file}")
-        return True
+_CANVASES = (
+    ("main_canvas", ("MainCanvas", 0)),
+    ("gameplay_canvas", ("GameplayCanvas", 1)),
+    ("ui_canvas", ("UICanvas", 2)),
+)
 
-    def setup_responsive_ui(self):
-        """Setup responsive UI for match-3 game"""
-        print("📱 Setting up responsive UI...")
-
-        # Create responsive UI configuration
-        responsive_ui_config = {
-            "breakpoints": {
-                "mobile_portrait": {
-                    "resolution": [720, 1280],
-                    "scale_factor": 0.8,
-                    "font_scale": 0.9,
-                    "spacing_scale": 0.8,
-                },
-                "mobile_landscape": {
-                    "resolution": [1280, 720],
-                    "scale_factor": 0.9,
-                    "font_scale": 1.0,
-                    "spacing_scale": 0.9,
-                },
-                "tablet_portrait": {
-                    "resolution": [768, 1024],
-                    "scale_factor": 1.0,
-                    "font_scale": 1.1,
-                    "spacing_scale": 1.0,
-                },
-                "tablet_landscape": {
-                    "resolution": [1024, 768],
-                    "scale_factor": 1.1,
-                    "font_scale": 1.2,
-                    "spacing_scale": 1.1,
-                },
-                "desktop": {
-                    "resolution": [1920, 1080],
-                    "scale_factor": 1.2,
-                    "font_scale": 1.3,
-                    "spacing_scale": 1.2,
-                },
-            },
-            "adaptive_ui": {
-                "enable_adaptive_ui": True,
-                "enable_dynamic_scaling": True,
-                "enable_content_fitting": True,
-                "enable_safe_area": True,
-            },
-        }
+_UI_CANVAS_CONFIG = {
+    key: {"name": name, **_CANVAS_DEFAULTS, "sorting_order": sorting_order}
+    for key, (name, sorting_order) in _CANVASES
+}
 
-        # Save responsive UI configuration
-        responsive_file = self.ui_dir / "ResponsiveUIConfig.json"
+_WHITE = (1.0, 1.0, 1.0, 1.0)
+_GREEN = (0.2, 0.8, 0.2, 1.0)
+_BLUE = (0.2, 0.6, 0.8, 1.0)
+
+
+def _text(name, text, font_size, color, position, size):
+    """Build a Text element config; tuples serialize straight to JSON arrays"""
+    return {
+        "name": name,
+        "type": "Text",
+        "text": text,
+        "font_size": font_size,
+        "color": color,
+        "position": (*position, 0),
+        "size": size,
+    }
 
-        with open(responsive_file, "w") as f:
-            json.dump(responsive_ui_config, f, indent=2)
 
-        print(f"✅ Responsive UI configured: {responsive_file}")
-        return True
+def _button(name, text, color, position, font_size=36, size=(200, 80)):
+    """Build a Button element config; tuples serialize straight to JSON arrays"""
+    return {
+        "name": name,
+        "type": "Button",
+        "text": text,
+        "font_size": font_size,
+        "color": color,
+        "position": (*position, 0),
+        "size": size,
+    }
 
-    def setup_ui_animations(self):
-        """Setup UI animations for match-3 game"""
-        print("🎬 Setting up UI animations...")
-
-        # Create UI animation configuration
-        ui_animations = {
-            "button_animations": {
-                "button_hover": {
-                    "duration": 0.2,
-                    "ease_type": "EaseOut",
-                    "scale_from": [1.0, 1.0, 1.0],
-                    "scale_to": [1.1, 1.1, 1.0],
-                    "color_from": [1.0, 1.0, 1.0, 1.0],
-                    "color_to": [1.2, 1.2, 1.2, 1.0],
-                },
-                "button_click": {
-                    "duration": 0.1,
-                    "ease_type": "EaseIn",
-                    "scale_from": [1.1, 1.1, 1.0],
-                    "scale_to": [0.95, 0.95, 1.0],
-                    "color_from": [1.2, 1.2, 1.2, 1.0],
-                    "color_to": [0.8, 0.8, 0.8, 1.0],
-                },
-            },
-            "text_animations": {
-                "score_popup": {
-                    "duration": 1.0,
-                    "ease_type": "BounceOut",
-                    "scale_from": [0.5, 0.5, 1.0],
-                    "scale_to": [1.2, 1.2, 1.0],
-                    "position_offset": [0, 50, 0],
-                    "alpha_from": 0.0,
-                    "alpha_to": 1.0,
-                },
-                "combo_text": {
-                    "duration": 0.8,
-                    "ease_type": "EaseOut",
-                    "scale_from": [0.8, 0.8, 1.0],
-                    "scale_to": [1.5, 1.5, 1.0],
-                    "alpha_from": 0.0,
-                    "alpha_to": 1.0,
-                },
-            },
-            "panel_animations": {
-                "panel_slide_in": {
-                    "duration": 0.5,
-                    "ease_type": "EaseOut",
-                    "position_from": [-800, 0, 0],
-                    "position_to": [0, 0, 0],
-                    "alpha_from": 0.0,
-                    "alpha_to": 1.0,
-                },
-                "panel_slide_out": {
-                    "duration": 0.3,
-                    "ease_type": "EaseIn",
-                    "position_from": [0, 0, 0],
-                    "position_to": [800, 0, 0],
-                    "alpha_from": 1.0,
-                    "alpha_to": 0.0,
-                },
-            },
-        }
 
-        # Save UI animations configuration
-        animations_file = self.ui_dir / "UIAnimations.json"
+_MATCH3_UI_ELEMENTS = {
+    "main_menu": {
+        "elements": [
+            _text("TitleText", "Evergreen Puzzler", 72, _WHITE, (0, 200), (600, 100)),
+            _button("PlayButton", "Play", _GREEN, (0, 0)),
+            _button("SettingsButton", "Settings", _BLUE, (0, -100)),
+            _button("QuitButton", "Quit", (0.8, 0.2, 0.2, 1.0), (0, -200)),
+        ]
+    },
+    "gameplay_ui": {
+        "elements": [
+            _text("ScoreText", "Score: 0", 48, _WHITE, (-400, 400), (300, 60)),
+            _text("MovesText", "Moves: 20", 36, _WHITE, (400, 400), (250, 50)),
+            _text("LevelText", "Level 1", 42, _WHITE, (0, 400), (200, 60)),
+            _button(
+                "PauseButton",
+                "Pause",
+                (0.8, 0.8, 0.2, 1.0),
+                (450, 450),
+                font_size=24,
+                size=(100, 50),
+            ),
+        ]
+    },
+    "game_over_ui": {
+        "elements": [
+            _text(
+                "GameOverText",
+                "Game Over",
+                64,
+                (1.0, 0.2, 0.2, 1.0),
+                (0, 100),
+                (400, 80),
+            ),
+            _text("FinalScoreText", "Final Score: 0", 36, _WHITE, (0, 0), (300, 50)),
+            _button("RestartButton", "Restart", _GREEN, (0, -100)),
+            _button("MainMenuButton", "Main Menu", _BLUE, (0, -200)),
+        ]
+    },
+    "level_complete_ui": {
+        "elements": [
+            _text(
+                "LevelCompleteText",
+                "Level Complete!",
+                64,
+                (0.2, 1.0, 0.2, 1.0),
+                (0, 100),
+                (500, 80),
+            ),
+            _text("StarsText", "⭐⭐⭐", 48, (1.0, 1.0, 0.0, 1.0), (0, 0), (300, 60)),
+            _button("NextLevelButton", "Next Level", _GREEN, (0, -100)),
+            _button("MainMenuButton", "Main Menu", _BLUE, (0, -200)),
+        ]
+    },
+}
 
-        with open(animations_file, "w") as f:
-            json.dump(ui_animations, f, indent=2)
+# JsonUtility cannot read dictionaries, so named entries are emitted as arrays
+_RESPONSIVE_UI_CONFIG = {
+    "breakpoints": [
+        {
+            "name": "mobile_portrait",
+            "resolution": [720, 1280],
+            "scale_factor": 0.8,
+            "font_scale": 0.9,
+            "spacing_scale": 0.8,
+        },
+        {
+            "name": "mobile_landscape",
+            "resolution": [1280, 720],
+            "scale_factor": 0.9,
+            "font_scale": 1.0,
+            "spacing_scale": 0.9,
+        },
+        {
+            "name": "tablet_portrait",
+            "resolution": [768, 1024],
+            "scale_factor": 1.0,
+            "font_scale": 1.1,
+            "spacing_scale": 1.0,
+        },
+        {
+            "name": "tablet_landscape",
+            "resolution": [1024, 768],
+            "scale_factor": 1.1,
+            "font_scale": 1.2,
+            "spacing_scale": 1.1,
+        },
+        {
+            "name": "desktop",
+            "resolution": [1920, 1080],
+            "scale_factor": 1.2,
+            "font_scale": 1.3,
+            "spacing_scale": 1.2,
+        },
+    ],
+    "adaptive_ui": {
+        "enable_adaptive_ui": True,
+        "enable_dynamic_scaling": True,
+        "enable_content_fitting": True,
+        "enable_safe_area": True,
+    },
+}
 
-        print(f"✅ UI animations configured: {animations_file}")
-        return True
+_UI_ANIMATIONS = {
+    "button_animations": [
+        {
+            "name": "button_hover",
+            "duration": 0.2,
+            "ease_type": "EaseOut",
+            "scale_from": [1.0, 1.0, 1.0],
+            "scale_to": [1.1, 1.1, 1.0],
+            "color_from": [1.0, 1.0, 1.0, 1.0],
+            "color_to": [1.2, 1.2, 1.2, 1.0],
+        },
+        {
+            "name": "button_click",
+            "duration": 0.1,
+            "ease_type": "EaseIn",
+            "scale_from": [1.1, 1.1, 1.0],
+            "scale_to": [0.95, 0.95, 1.0],
+            "color_from": [1.2, 1.2, 1.2, 1.0],
+            "color_to": [0.8, 0.8, 0.8, 1.0],
+        },
+    ],
+    "text_animations": [
+        {
+            "name": "score_popup",
+            "duration": 1.0,
+            "ease_type": "BounceOut",
+            "scale_from": [0.5, 0.5, 1.0],
+            "scale_to": [1.2, 1.2, 1.0],
+            "position_offset": [0, 50, 0],
+            "alpha_from": 0.0,
+            "alpha_to": 1.0,
+        },
+        {
+            "name": "combo_text",
+            "duration": 0.8,
+            "ease_type": "EaseOut",
+            "scale_from": [0.8, 0.8, 1.0],
+            "scale_to": [1.5, 1.5, 1.0],
+            "alpha_from": 0.0,
+            "alpha_to": 1.0,
+        },
+    ],
+    "panel_animations": [
+        {
+            "name": "panel_slide_in",
+            "duration": 0.5,
+            "ease_type": "EaseOut",
+            "position_from": [-800, 0, 0],
+            "position_to": [0, 0, 0],
+            "alpha_from": 0.0,
+            "alpha_to": 1.0,
+        },
+        {
+            "name": "panel_slide_out",
+            "duration": 0.3,
+            "ease_type": "EaseIn",
+            "position_from": [0, 0, 0],
+            "position_to": [800, 0, 0],
+            "alpha_from": 1.0,
+            "alpha_to": 0.0,
+        },
+    ],
+}
 
-    def create_ui_automation_script(self):
-        """Create Unity Editor script for UI automation"""
-        print("📝 Creating UI automation script...")
+# Everything the editor script needs, so Unity reads and parses one file
+_MATCH3_UI = {
+    "canvas": _UI_CANVAS_CONFIG,
+    "elements": _MATCH3_UI_ELEMENTS,
+    "responsive": _RESPONSIVE_UI_CONFIG,
+    "animations": _UI_ANIMATIONS,
+}
 
-        script_content = """
+_CS_SCRIPT = """
 using UnityEngine;
 using UnityEditor;
 using UnityEngine.UI;
@@ -431,18 +322,32 @@ namespace Evergreen.Editor
             }
         }
 
+        private const string ConfigPath = "Assets/UI/Match3UI.json";
+
+        private static Match3UIBundle cachedConfig;
+
+        private static Match3UIBundle LoadConfig()
+        {
+            // Read and parse the merged config once, then serve it from memory
+            if (cachedConfig == null && File.Exists(ConfigPath))
+            {
+                cachedConfig = JsonUtility.FromJson<Match3UIBundle>(File.ReadAllText(ConfigPath));
+            }
+
+            return cachedConfig;
+        }
+
         private static void SetupUICanvas()
         {
             try
             {
                 Debug.Log("🎨 Setting up UI Canvas...");
 
-                // Load UI Canvas configuration
-                string configPath = "Assets/UI/Match3UICanvas.json";
-                if (File.Exists(configPath))
+                // Load UI configuration
+                var bundle = LoadConfig();
+                if (bundle != null)
                 {
-                    string json = File.ReadAllText(configPath);
-                    var config = JsonUtility.FromJson<UICanvasConfig>(json);
+                    var config = bundle.canvas;
 
                     // Create main canvas
                     CreateCanvas(config.main_canvas);
@@ -457,7 +362,7 @@ namespace Evergreen.Editor
                 }
                 else
                 {
-                    Debug.LogWarning("⚠️ Match3UICanvas.json not found");
+                    Debug.LogWarning("⚠️ Match3UI.json not found");
                 }
             }
             catch (System.Exception e)
@@ -500,12 +405,11 @@ namespace Evergreen.Editor
             {
                 Debug.Log("🎮 Setting up UI Elements...");
 
-                // Load UI elements configuration
-                string configPath = "Assets/UI/Match3UIElements.json";
-                if (File.Exists(configPath))
+                // Load UI configuration
+                var bundle = LoadConfig();
+                if (bundle != null)
                 {
-                    string json = File.ReadAllText(configPath);
-                    var config = JsonUtility.FromJson<Match3UIConfig>(json);
+                    var config = bundle.elements;
 
                     // Create main menu UI
                     CreateUIElements(config.main_menu, "MainMenu");
@@ -523,7 +427,7 @@ namespace Evergreen.Editor
                 }
                 else
                 {
-                    Debug.LogWarning("⚠️ Match3UIElements.json not found");
+                    Debug.LogWarning("⚠️ Match3UI.json not found");
                 }
             }
             catch (System.Exception e)
@@ -621,21 +525,18 @@ namespace Evergreen.Editor
             {
                 Debug.Log("📱 Setting up Responsive UI...");
 
-                // Load responsive UI configuration
-                string configPath = "Assets/UI/ResponsiveUIConfig.json";
-                if (File.Exists(configPath))
+                // Load UI configuration
+                var bundle = LoadConfig();
+                if (bundle != null)
                 {
-                    string json = File.ReadAllText(configPath);
-                    var config = JsonUtility.FromJson<ResponsiveUIConfig>(json);
-
                     // Create responsive UI manager
-                    CreateResponsiveUIManager(config);
+                    CreateResponsiveUIManager(bundle.responsive);
 
                     Debug.Log("✅ Responsive UI setup completed!");
                 }
                 else
                 {
-                    Debug.LogWarning("⚠️ ResponsiveUIConfig.json not found");
+                    Debug.LogWarning("⚠️ Match3UI.json not found");
                 }
             }
             catch (System.Exception e)
@@ -667,21 +568,18 @@ namespace Evergreen.Editor
             {
                 Debug.Log("🎬 Setting up UI Animations...");
 
-                // Load UI animations configuration
-                string configPath = "Assets/UI/UIAnimations.json";
-                if (File.Exists(configPath))
+                // Load UI configuration
+                var bundle = LoadConfig();
+                if (bundle != null)
                 {
-                    string json = File.ReadAllText(configPath);
-                    var config = JsonUtility.FromJson<UIAnimationsConfig>(json);
-
                     // Create UI animation manager
-                    CreateUIAnimationManager(config);
+                    CreateUIAnimationManager(bundle.animations);
 
                     Debug.Log("✅ UI Animations setup completed!");
                 }
                 else
                 {
-                    Debug.LogWarning("⚠️ UIAnimations.json not found");
+                    Debug.LogWarning("⚠️ Match3UI.json not found");
                 }
             }
             catch (System.Exception e)
@@ -714,6 +612,9 @@ namespace Evergreen.Editor
             {
                 Debug.Log("🎯 Running full Match-3 UI automation...");
 
+                // Pick up any config regenerated since the last run
+                cachedConfig = null;
+
                 SetupUICanvas();
                 SetupUIElements();
                 SetupResponsiveUI();
@@ -729,6 +630,15 @@ namespace Evergreen.Editor
     }
 
     // Data structures for JSON deserialization
+    [System.Serializable]
+    public class Match3UIBundle
+    {
+        public UICanvasConfig canvas;
+        public Match3UIConfig elements;
+        public ResponsiveUIConfig responsive;
+        public UIAnimationsConfig animations;
+    }
+
     [System.Serializable]
     public class UICanvasConfig
     {
@@ -747,16 +657,6 @@ namespace Evergreen.Editor
         public int[] reference_resolution;
         public string screen_match_mode;
         public float match_width_or_height;
-        public CanvasScalerData canvas_scaler;
-    }
-
-    [System.Serializable]
-    public class CanvasScalerData
-    {
-        public string ui_scale_mode;
-        public int[] reference_resolution;
-        public string screen_match_mode;
-        public float match_width_or_height;
     }
 
     [System.Serializable]
@@ -789,13 +689,14 @@ namespace Evergreen.Editor
     [System.Serializable]
     public class ResponsiveUIConfig
     {
-        public Dictionary<string, Breakpoint> breakpoints;
+        public Breakpoint[] breakpoints;
         public AdaptiveUI adaptive_ui;
     }
 
     [System.Serializable]
     public class Breakpoint
     {
+        public string name;
         public int[] resolution;
         public float scale_factor;
         public float font_scale;
@@ -814,14 +715,15 @@ namespace Evergreen.Editor
     [System.Serializable]
     public class UIAnimationsConfig
     {
-        public Dictionary<string, ButtonAnimation> button_animations;
-        public Dictionary<string, TextAnimation> text_animations;
-        public Dictionary<string, PanelAnimation> panel_animations;
+        public ButtonAnimation[] button_animations;
+        public TextAnimation[] text_animations;
+        public PanelAnimation[] panel_animations;
     }
 
     [System.Serializable]
     public class ButtonAnimation
     {
+        public string name;
         public float duration;
         public string ease_type;
         public float[] scale_from;
@@ -833,6 +735,7 @@ namespace Evergreen.Editor
     [System.Serializable]
     public class TextAnimation
     {
+        public string name;
         public float duration;
         public string ease_type;
         public float[] scale_from;
@@ -845,6 +748,7 @@ namespace Evergreen.Editor
     [System.Serializable]
     public class PanelAnimation
     {
+        public string name;
         public float duration;
         public string ease_type;
         public float[] position_from;
@@ -856,63 +760,108 @@ namespace Evergreen.Editor
     // Component classes for runtime
     public class ResponsiveUIManager : MonoBehaviour
     {
-        public Dictionary<string, Breakpoint> breakpoints;
-        public AdaptiveUI adaptive_ui;
+        public Breakpoint[] breakpoints;
+        public AdaptiveUI adaptiveUI;
     }
 
     public class UIAnimationManager : MonoBehaviour
     {
-        public Dictionary<string, ButtonAnimation> buttonAnimations;
-        public Dictionary<string, TextAnimation> textAnimations;
-        public Dictionary<string, PanelAnimation> panelAnimations;
+        public ButtonAnimation[] buttonAnimations;
+        public TextAnimation[] textAnimations;
+        public PanelAnimation[] panelAnimations;
     }
 }
 """
 
+
+def _encode_json(config):
+    """Encode config as JSON bytes, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if _PRETTY_JSON else 0
+        return orjson.dumps(config, option=option)
+    if _PRETTY_JSON:
+        return json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(config, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class Match3UIAutomation:
+    __slots__ = (
+        "repo_root",
+        "unity_assets",
+        "ui_dir",
+        "prefabs_dir",
+        "combined_file",
+    )
+
+    def __init__(self):
+        self.repo_root = Path(__file__).parent.parent.parent
+        self.unity_assets = self.repo_root / "unity" / "Assets"
+        self.ui_dir = self.unity_assets / "UI"
+        self.prefabs_dir = self.unity_assets / "Prefabs" / "UI"
+        self.ui_dir.mkdir(parents=True, exist_ok=True)
+        self.prefabs_dir.mkdir(parents=True, exist_ok=True)
+
+        # Resolve the config target once as a plain string for the write path
+        self.combined_file = os.path.join(str(self.ui_dir), "Match3UI.json")
+
+    def _dump_json(self, path, config):
+        """Encode config once and write it only if the file content changed"""
+        payload = _encode_json(config)
+        try:
+            with open(path, "rb") as f:
+                if f.read() == payload:
+                    return
+        except FileNotFoundError:
+            pass
+        with open(path, "wb") as f:
+            f.write(payload)
+
+    def setup_all(self):
+        """Setup the merged UI config read by the Unity Editor script"""
+        logger.info("📦 Setting up merged UI configuration...")
+
+        # Save merged UI configuration
+        self._dump_json(self.combined_file, _MATCH3_UI)
+
+        logger.info("✅ Merged UI configuration saved: %s", self.combined_file)
+        return True
+
+    def create_ui_automation_script(self):
+        """Create Unity Editor script for UI automation"""
+        logger.info("📝 Creating UI automation script...")
+
         # Save Unity Editor script
         script_path = self.unity_assets / "Editor" / "Match3UIAutomation.cs"
         script_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(script_path, "w") as f:
-            f.write(script_content)
+        # Skip the write when nothing changed so Unity does not recompile
+        new_content = _CS_SCRIPT.encode("utf-8")
+        if script_path.exists() and script_path.read_bytes() == new_content:
+            logger.info("✅ Match-3 UI automation script unchanged: %s", script_path)
+            return True
 
-        print(f"✅ Match-3 UI automation script created: {script_path}")
+        script_path.write_bytes(new_content)
+
+        logger.info("✅ Match-3 UI automation script created: %s", script_path)
         return True
 
     def run_full_automation(self):
         """Run complete match-3 UI automation"""
-        self.print_header("Match-3 UI Full Automation")
-
-        print("🎯 This will automate Match-3 specific UI setup")
-        print("   - UI Canvas configuration (Main, Gameplay, UI)")
-        print("   - UI Elements (Main Menu, Gameplay, Game Over, Level Complete)")
-        print("   - Responsive UI for different screen sizes")
-        print("   - UI Animations (buttons, text, panels)")
-        print("   - UI Prefabs generation")
+        sys.stdout.write(_INTRO_BANNER)
 
         success = True
 
         # Run all automation steps
-        success &= self.setup_match3_ui_canvas()
-        success &= self.setup_match3_ui_elements()
-        success &= self.setup_responsive_ui()
-        success &= self.setup_ui_animations()
+        success &= self.setup_all()
         success &= self.create_ui_automation_script()
 
-        if success:
-            print("\n🎉 Match-3 UI automation completed successfully!")
-            print("✅ UI Canvas configured")
-            print("✅ UI Elements setup")
-            print("✅ Responsive UI configured")
-            print("✅ UI Animations setup")
-            print("✅ UI Prefabs generated")
-            print("✅ Unity Editor automation script created")
-        else:
-            print("\n⚠️ Some Match-3 UI automation steps failed")
+        sys.stdout.write(_SUCCESS_BANNER if success else _FAILURE_BANNER)
+        sys.stdout.flush()
 
         return success
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     automation = Match3UIAutomation()
     automation.run_full_automation()
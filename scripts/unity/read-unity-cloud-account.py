@@ -9,11 +9,186 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
+# Browser-like headers sent with every dashboard request
+_BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# Pages are streamed and capped; the data we look for sits near the top
+_MAX_PAGE_BYTES = 2 << 20
+_CHUNK_BYTES = 64 << 10
+
+# Dashboard pages embed their app state as "<marker> = {...};"; one
+# alternation finds every marker in a single scan of the page
+_STATE_BLOB_RE = re.compile(
+    r"(window\.|var\s+)__(?:INITIAL|PRELOADED|APP)_STATE__\s*=\s*(?=\{)"
+)
+# Whole string literals are consumed so braces inside them are not counted
+_BRACE_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.DOTALL)
+
+
+def _match_braces(text, start):
+    """Return the end index of the object opened at start, or -1"""
+    depth = 0
+    for token in _BRACE_TOKEN_RE.finditer(text, start):
+        brace = token.group()
+        if brace == "{":
+            depth += 1
+        elif brace == "}":
+            depth -= 1
+            if not depth:
+                return token.end()
+    return -1
+
+
+def _iter_state_blobs(html_content, window_only=False):
+    """Yield the JSON objects assigned to the page's state markers"""
+    match = _STATE_BLOB_RE.search(html_content)
+    while match:
+        pos = match.end()
+        if not window_only or match.group(1) == "window.":
+            end = _match_braces(html_content, pos)
+            if end > 0:
+                try:
+                    yield _json_loads(html_content[pos:end])
+                except json.JSONDecodeError:
+                    pass
+                pos = end
+        match = _STATE_BLOB_RE.search(html_content, pos)
+
+
+# A single tokenizer pass yields every "key":"value" string field; extractors
+# classify them with one word alternation each instead of rescanning the
+# whole body once per field pattern.
+_JSON_FIELD_RE = re.compile(r'"(id|name|cost|price)":"([^"]*)"', re.IGNORECASE)
+
+
+def _word_re(words):
+    """Compile marker words into one case-insensitive alternation"""
+    return re.compile("|".join(words), re.IGNORECASE) if words else None
+
+
+def _text_res(words):
+    """Compile the "<word> ... >text<" pattern for each marker word
+
+    A marker counts wherever it appears, in a tag or in the text before the
+    next tag, so "coin balance: <b>500</b>" yields "500".
+    """
+    return tuple(re.compile(rf"{word}[^>]*>([^<]+)<", re.IGNORECASE) for word in words)
+
+
+def _markers(field_words, tag_words, value_keys=()):
+    """Build the (field, text, any-marker, value keys) spec for an extractor"""
+    return (
+        _word_re(field_words),
+        _text_res(tag_words),
+        _word_re((*field_words, *tag_words, *value_keys)),
+        value_keys,
+    )
+
+
+_ECONOMY_KEYS = ("currencies", "inventory", "catalog")
+
+_CURRENCY_MARKERS = _markers(
+    ("coin", "gem", "energy"), ("currency", "coin", "gem", "energy")
+)
+_INVENTORY_MARKERS = _markers(("booster", "pack"), ("inventory", "booster", "pack"))
+_CATALOG_MARKERS = _markers(
+    ("pack",), ("catalog", "purchase", "buy"), value_keys=("cost", "price")
+)
+_CONFIG_MARKERS = _markers((), ("config", "setting", "parameter", "value"))
+_FUNCTION_MARKERS = _markers(("function", "script"), ("function", "script", "code"))
+
+
+def _extract_from_html(html_content, markers):
+    """Collect field values and tag text matching the given markers"""
+    field_re, text_res, any_re, value_keys = markers
+
+    # Most dashboard URLs return a generic shell page; skip the scan when
+    # none of the markers appear anywhere in it
+    if not any_re.search(html_content):
+        return []
+
+    # Insertion-ordered dedupe keeps output stable between runs
+    found = {}
+
+    for key, value in _JSON_FIELD_RE.findall(html_content):
+        key = key.lower()
+        if key in value_keys:
+            found[value.strip()] = None
+        elif key in ("id", "name") and field_re and field_re.search(value):
+            found[value.strip()] = None
+
+    for text_re in text_res:
+        for text in text_re.findall(html_content):
+            found[text.strip()] = None
+
+    return [item for item in found if len(item) > 1]
+
+
+@lru_cache(maxsize=None)
+def _read_csv_rows(path, mtime_ns):
+    """Parse a CSV file into (header, rows); mtime_ns keys the cache"""
+    with open(path, "r", newline="") as f:
+        reader = csv.reader(f)
+        return next(reader, []), tuple(reader)
+
+
+@lru_cache(maxsize=None)
+def _read_json_file(path, mtime_ns):
+    """Parse a JSON file; mtime_ns is part of the cache key so edits show up"""
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
+def _load_csv(path):
+    """Return the cached header and rows of a local CSV file"""
+    return _read_csv_rows(str(path), os.stat(path).st_mtime_ns)
+
+
+def _csv_columns(path, names):
+    """Return the named columns of each non-blank row of a local CSV file"""
+    header, rows = _load_csv(path)
+    rows = [row for row in rows if row]
+    if not rows:
+        return []
+    # A missing column raises KeyError, as indexing a DictReader row would
+    positions = {name: i for i, name in enumerate(header)}
+    indexes = [positions[name] for name in names]
+    last = max(indexes)
+    return [[row[i] for i in indexes] for row in rows if len(row) > last]
+
+
+def _load_json(path):
+    """Return the cached contents of a local JSON file"""
+    return _read_json_file(str(path), os.stat(path).st_mtime_ns)
+
+
+def _emit(lines):
+    """Write a block of output lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 class UnityCloudAccountReader:
@@ -27,6 +202,31 @@ class UnityCloudAccountReader:
         self.base_url = "https://cloud.unity.com"
         self.project_url = f"{self.base_url}/projects/{self.project_id}"
 
+        # One keep-alive session shared by every service read
+        self.session = requests.Session()
+        self.session.headers.update(_BROWSER_HEADERS)
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+        # Dashboard pages read for each service
+        self.endpoints = {
+            "economy": [
+                f"{self.project_url}/economy",
+                f"{self.project_url}/economy/currencies",
+                f"{self.project_url}/economy/inventory",
+                f"{self.project_url}/economy/catalog",
+            ],
+            "remote_config": [
+                f"{self.project_url}/remote-config",
+                f"{self.project_url}/remote-config/configs",
+            ],
+            "cloud_code": [
+                f"{self.project_url}/cloud-code",
+                f"{self.project_url}/cloud-code/functions",
+            ],
+        }
+        self.pages = {}
+        self._cloud_reachable = None
+
         # Results
         self.results = {
             "timestamp": datetime.now().isoformat(),
@@ -38,15 +238,64 @@ class UnityCloudAccountReader:
         }
 
     def print_header(self):
-        print("=" * 80)
-        print("📖 UNITY CLOUD ACCOUNT READER")
-        print("=" * 80)
-        print(f"Project ID: {self.project_id}")
-        print(f"Environment ID: {self.environment_id}")
-        print(f"Organization ID: {self.organization_id}")
-        print(f"Email: {self.email}")
-        print(f"Timestamp: {self.results['timestamp']}")
-        print("=" * 80)
+        _emit(
+            [
+                "=" * 80,
+                "📖 UNITY CLOUD ACCOUNT READER",
+                "=" * 80,
+                f"Project ID: {self.project_id}",
+                f"Environment ID: {self.environment_id}",
+                f"Organization ID: {self.organization_id}",
+                f"Email: {self.email}",
+                f"Timestamp: {self.results['timestamp']}",
+                "=" * 80,
+            ]
+        )
+
+    def _fetch(self, endpoint):
+        """Fetch a dashboard page, returning its HTML or None"""
+        try:
+            with self.session.get(endpoint, timeout=15, stream=True) as response:
+                if response.status_code != 200:
+                    return None
+                body = bytearray()
+                for chunk in response.iter_content(_CHUNK_BYTES):
+                    body += chunk
+                    if len(body) >= _MAX_PAGE_BYTES:
+                        break
+            return body.decode("utf-8", errors="replace")
+        except Exception as e:
+            print(f"   ❌ Error reading {endpoint}: {e}")
+        return None
+
+    def cloud_reachable(self):
+        """Probe Unity Cloud once so offline runs skip the endpoint fetches"""
+        if self._cloud_reachable is None:
+            try:
+                self.session.head(self.base_url, timeout=2)
+                self._cloud_reachable = True
+            except requests.RequestException:
+                print("   ⚠️ Unity Cloud is unreachable, skipping endpoint reads")
+                self._cloud_reachable = False
+        return self._cloud_reachable
+
+    def prefetch_pages(self):
+        """Fetch every service endpoint concurrently"""
+        if not self.cloud_reachable():
+            return
+        endpoints = [url for urls in self.endpoints.values() for url in urls]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(self._fetch, url): url for url in endpoints}
+            for future in as_completed(futures):
+                self.pages[futures[future]] = future.result()
+
+    def fetch_page(self, endpoint):
+        """Return a prefetched page, fetching it now if needed"""
+        if endpoint not in self.pages:
+            self.pages[endpoint] = (
+                self._fetch(endpoint) if self.cloud_reachable() else None
+            )
+        return self.pages[endpoint]
 
     def read_economy_data(self):
         """Read actual economy data from Unity Cloud"""
@@ -61,40 +310,15 @@ class UnityCloudAccountReader:
         }
 
         try:
-            # Try to read economy data using different methods
-            economy_endpoints = [
-                f"{self.base_url}/projects/{self.project_id}/economy",
-                f"{self.base_url}/projects/{self.project_id}/economy/currencies",
-                f"{self.base_url}/projects/{self.project_id}/economy/inventory",
-                f"{self.base_url}/projects/{self.project_id}/economy/catalog",
-            ]
-
-            session = requests.Session()
-            session.headers.update(
-                {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                }
-            )
-
-            for endpoint in economy_endpoints:
-                try:
-                    response = session.get(endpoint, timeout=15)
-
-                    if response.status_code == 200:
-                        # Try to extract data from the response
-                        data = self.extract_economy_data_from_response(
-                            response.text, endpoint
-                        )
-                        if data:
-                            economy_data["economy_data"].update(data)
-
-                except Exception as e:
-                    print(f"   ❌ Error reading {endpoint}: {e}")
+            for endpoint in self.endpoints["economy"]:
+                html_content = self.fetch_page(endpoint)
+                if html_content is not None:
+                    # Try to extract data from the response
+                    data = self.extract_economy_data_from_response(
+                        html_content, endpoint
+                    )
+                    if data:
+                        economy_data["economy_data"].update(data)
 
             # If we couldn't read from Unity Cloud, fall back to local data
             if not economy_data["economy_data"]:
@@ -111,24 +335,23 @@ class UnityCloudAccountReader:
             inventory = economy_data["economy_data"].get("inventory", [])
             catalog = economy_data["economy_data"].get("catalog", [])
 
-            print(
+            lines = [
                 f"✅ Economy Data: Found {len(currencies)} currencies, {len(inventory)} inventory items, {len(catalog)} catalog items"
-            )
+            ]
 
             if currencies:
-                print("   📊 Currencies:")
-                for currency in currencies:
-                    print(f"     - {currency}")
+                lines.append("   📊 Currencies:")
+                lines.extend(f"     - {currency}" for currency in currencies)
 
             if inventory:
-                print("   📦 Inventory:")
-                for item in inventory:
-                    print(f"     - {item}")
+                lines.append("   📦 Inventory:")
+                lines.extend(f"     - {item}" for item in inventory)
 
             if catalog:
-                print("   🛒 Catalog:")
-                for item in catalog:
-                    print(f"     - {item}")
+                lines.append("   🛒 Catalog:")
+                lines.extend(f"     - {item}" for item in catalog)
+
+            _emit(lines)
 
         except Exception as e:
             economy_data["status"] = "error"
@@ -142,28 +365,19 @@ class UnityCloudAccountReader:
         """Extract economy data from HTML response"""
         data = {}
 
-        # Look for JSON data in script tags
-        json_patterns = [
-            r"window\.__INITIAL_STATE__\s*=\s*({.+?});",
-            r"window\.__PRELOADED_STATE__\s*=\s*({.+?});",
-            r"window\.__APP_STATE__\s*=\s*({.+?});",
-            r"var\s+__INITIAL_STATE__\s*=\s*({.+?});",
-            r"var\s+__PRELOADED_STATE__\s*=\s*({.+?});",
-        ]
-
-        for pattern in json_patterns:
-            matches = re.findall(pattern, html_content, re.DOTALL)
-            for match in matches:
-                try:
-                    json_data = json.loads(match)
-                    if (
-                        "economy" in json_data
-                        or "currencies" in json_data
-                        or "inventory" in json_data
-                    ):
-                        data.update(self.extract_economy_from_json(json_data))
-                except BaseException:
-                    continue
+        for json_data in _iter_state_blobs(html_content):
+            economy = json_data.get("economy")
+            if economy is None and not (
+                "currencies" in json_data or "inventory" in json_data
+            ):
+                continue
+
+            # Top-level keys win over the nested economy section
+            for source in (economy, json_data):
+                if isinstance(source, dict):
+                    for key in _ECONOMY_KEYS:
+                        if key in source:
+                            data[key] = source[key]
 
         # Look for specific data based on endpoint
         if "currencies" in endpoint:
@@ -181,101 +395,17 @@ class UnityCloudAccountReader:
 
         return data
 
-    def extract_economy_from_json(self, json_data):
-        """Extract economy data from JSON"""
-        economy_data = {}
-
-        # Look for economy data in various structures
-        if "economy" in json_data:
-            economy = json_data["economy"]
-            if "currencies" in economy:
-                economy_data["currencies"] = economy["currencies"]
-            if "inventory" in economy:
-                economy_data["inventory"] = economy["inventory"]
-            if "catalog" in economy:
-                economy_data["catalog"] = economy["catalog"]
-
-        # Look for direct data
-        if "currencies" in json_data:
-            economy_data["currencies"] = json_data["currencies"]
-        if "inventory" in json_data:
-            economy_data["inventory"] = json_data["inventory"]
-        if "catalog" in json_data:
-            economy_data["catalog"] = json_data["catalog"]
-
-        return economy_data
-
     def extract_currencies_from_html(self, html_content):
         """Extract currencies from HTML content"""
-        currencies = []
-
-        # Look for currency data in various formats
-        currency_patterns = [
-            r'"id":"([^"]*coin[^"]*)"',
-            r'"id":"([^"]*gem[^"]*)"',
-            r'"id":"([^"]*energy[^"]*)"',
-            r'"name":"([^"]*coin[^"]*)"',
-            r'"name":"([^"]*gem[^"]*)"',
-            r'"name":"([^"]*energy[^"]*)"',
-            r"currency[^>]*>([^<]+)<",
-            r"coin[^>]*>([^<]+)<",
-            r"gem[^>]*>([^<]+)<",
-            r"energy[^>]*>([^<]+)<",
-        ]
-
-        for pattern in currency_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                if match.strip() and len(match.strip()) > 1:
-                    currencies.append(match.strip())
-
-        return list(set(currencies))
+        return _extract_from_html(html_content, _CURRENCY_MARKERS)
 
     def extract_inventory_from_html(self, html_content):
         """Extract inventory from HTML content"""
-        inventory = []
-
-        # Look for inventory data
-        inventory_patterns = [
-            r'"id":"([^"]*booster[^"]*)"',
-            r'"id":"([^"]*pack[^"]*)"',
-            r'"name":"([^"]*booster[^"]*)"',
-            r'"name":"([^"]*pack[^"]*)"',
-            r"inventory[^>]*>([^<]+)<",
-            r"booster[^>]*>([^<]+)<",
-            r"pack[^>]*>([^<]+)<",
-        ]
-
-        for pattern in inventory_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                if match.strip() and len(match.strip()) > 1:
-                    inventory.append(match.strip())
-
-        return list(set(inventory))
+        return _extract_from_html(html_content, _INVENTORY_MARKERS)
 
     def extract_catalog_from_html(self, html_content):
         """Extract catalog from HTML content"""
-        catalog = []
-
-        # Look for catalog data
-        catalog_patterns = [
-            r'"id":"([^"]*pack[^"]*)"',
-            r'"name":"([^"]*pack[^"]*)"',
-            r'"cost":"([^"]*)"',
-            r'"price":"([^"]*)"',
-            r"catalog[^>]*>([^<]+)<",
-            r"purchase[^>]*>([^<]+)<",
-            r"buy[^>]*>([^<]+)<",
-        ]
-
-        for pattern in catalog_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                if match.strip() and len(match.strip()) > 1:
-                    catalog.append(match.strip())
-
-        return list(set(catalog))
+        return _extract_from_html(html_content, _CATALOG_MARKERS)
 
     def read_local_economy_data(self):
         """Read local economy data as reference"""
@@ -285,12 +415,13 @@ class UnityCloudAccountReader:
         currencies_path = Path("/workspace/economy/currencies.csv")
         if currencies_path.exists():
             try:
-                with open(currencies_path, "r") as f:
-                    reader = csv.DictReader(f)
-                    currencies = []
-                    for row in reader:
-                        currencies.append(f"{row['id']}: {row['name']} ({row['type']})")
-                    economy_data["currencies"] = currencies
+                currencies = [
+                    f"{id_}: {name} ({type_})"
+                    for id_, name, type_ in _csv_columns(
+                        currencies_path, ("id", "name", "type")
+                    )
+                ]
+                economy_data["currencies"] = currencies
             except Exception as e:
                 print(f"   ❌ Error reading currencies: {e}")
 
@@ -298,12 +429,13 @@ class UnityCloudAccountReader:
         inventory_path = Path("/workspace/economy/inventory.csv")
         if inventory_path.exists():
             try:
-                with open(inventory_path, "r") as f:
-                    reader = csv.DictReader(f)
-                    inventory = []
-                    for row in reader:
-                        inventory.append(f"{row['id']}: {row['name']} ({row['type']})")
-                    economy_data["inventory"] = inventory
+                inventory = [
+                    f"{id_}: {name} ({type_})"
+                    for id_, name, type_ in _csv_columns(
+                        inventory_path, ("id", "name", "type")
+                    )
+                ]
+                economy_data["inventory"] = inventory
             except Exception as e:
                 print(f"   ❌ Error reading inventory: {e}")
 
@@ -311,14 +443,13 @@ class UnityCloudAccountReader:
         catalog_path = Path("/workspace/economy/catalog.csv")
         if catalog_path.exists():
             try:
-                with open(catalog_path, "r") as f:
-                    reader = csv.DictReader(f)
-                    catalog = []
-                    for row in reader:
-                        catalog.append(
-                            f"{row['id']}: {row['name']} ({row['cost_currency']}: {row['cost_amount']})"
-                        )
-                    economy_data["catalog"] = catalog
+                catalog = [
+                    f"{id_}: {name} ({currency}: {amount})"
+                    for id_, name, currency, amount in _csv_columns(
+                        catalog_path, ("id", "name", "cost_currency", "cost_amount")
+                    )
+                ]
+                economy_data["catalog"] = catalog
             except Exception as e:
                 print(f"   ❌ Error reading catalog: {e}")
 
@@ -337,37 +468,12 @@ class UnityCloudAccountReader:
         }
 
         try:
-            # Try to read remote config data
-            config_endpoints = [
-                f"{self.base_url}/projects/{self.project_id}/remote-config",
-                f"{self.base_url}/projects/{self.project_id}/remote-config/configs",
-            ]
-
-            session = requests.Session()
-            session.headers.update(
-                {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                }
-            )
-
-            for endpoint in config_endpoints:
-                try:
-                    response = session.get(endpoint, timeout=15)
-
-                    if response.status_code == 200:
-                        data = self.extract_remote_config_data_from_response(
-                            response.text
-                        )
-                        if data:
-                            remote_config_data["config_data"].update(data)
-
-                except Exception as e:
-                    print(f"   ❌ Error reading {endpoint}: {e}")
+            for endpoint in self.endpoints["remote_config"]:
+                html_content = self.fetch_page(endpoint)
+                if html_content is not None:
+                    data = self.extract_remote_config_data_from_response(html_content)
+                    if data:
+                        remote_config_data["config_data"].update(data)
 
             # If we couldn't read from Unity Cloud, fall back to local data
             if not remote_config_data["config_data"]:
@@ -381,12 +487,13 @@ class UnityCloudAccountReader:
 
             # Display the data
             configs = remote_config_data["config_data"].get("configs", [])
-            print(f"✅ Remote Config Data: Found {len(configs)} configurations")
+            lines = [f"✅ Remote Config Data: Found {len(configs)} configurations"]
 
             if configs:
-                print("   ⚙️ Configurations:")
-                for config in configs:
-                    print(f"     - {config}")
+                lines.append("   ⚙️ Configurations:")
+                lines.extend(f"     - {config}" for config in configs)
+
+            _emit(lines)
 
         except Exception as e:
             remote_config_data["status"] = "error"
@@ -400,57 +507,20 @@ class UnityCloudAccountReader:
         """Extract remote config data from HTML response"""
         data = {}
 
-        # Look for JSON data in script tags
-        json_patterns = [
-            r"window\.__INITIAL_STATE__\s*=\s*({.+?});",
-            r"window\.__PRELOADED_STATE__\s*=\s*({.+?});",
-            r"window\.__APP_STATE__\s*=\s*({.+?});",
-        ]
-
-        for pattern in json_patterns:
-            matches = re.findall(pattern, html_content, re.DOTALL)
-            for match in matches:
-                try:
-                    json_data = json.loads(match)
-                    if "remoteConfig" in json_data or "configs" in json_data:
-                        data.update(self.extract_config_from_json(json_data))
-                except BaseException:
-                    continue
-
-        # Look for config data patterns
-        config_patterns = [
-            r"config[^>]*>([^<]+)<",
-            r"setting[^>]*>([^<]+)<",
-            r"parameter[^>]*>([^<]+)<",
-            r"value[^>]*>([^<]+)<",
-        ]
-
-        configs = []
-        for pattern in config_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                if match.strip() and len(match.strip()) > 1:
-                    configs.append(match.strip())
+        # Remote config pages only expose the window.* state blobs
+        for json_data in _iter_state_blobs(html_content, window_only=True):
+            remote_config = json_data.get("remoteConfig")
+            if "configs" in json_data:
+                data["configs"] = json_data["configs"]
+            elif isinstance(remote_config, dict) and "configs" in remote_config:
+                data["configs"] = remote_config["configs"]
 
+        configs = _extract_from_html(html_content, _CONFIG_MARKERS)
         if configs:
-            data["configs"] = list(set(configs))
+            data["configs"] = configs
 
         return data
 
-    def extract_config_from_json(self, json_data):
-        """Extract config data from JSON"""
-        config_data = {}
-
-        if "remoteConfig" in json_data:
-            config = json_data["remoteConfig"]
-            if "configs" in config:
-                config_data["configs"] = config["configs"]
-
-        if "configs" in json_data:
-            config_data["configs"] = json_data["configs"]
-
-        return config_data
-
     def read_local_remote_config_data(self):
         """Read local remote config data as reference"""
         config_data = {}
@@ -459,12 +529,11 @@ class UnityCloudAccountReader:
         config_path = Path("/workspace/remote-config/remote-config.json")
         if config_path.exists():
             try:
-                with open(config_path, "r") as f:
-                    data = json.load(f)
-                    configs = []
-                    for category, settings in data.items():
-                        configs.append(f"{category}: {len(settings)} settings")
-                    config_data["configs"] = configs
+                data = _load_json(config_path)
+                configs = []
+                for category, settings in data.items():
+                    configs.append(f"{category}: {len(settings)} settings")
+                config_data["configs"] = configs
             except Exception as e:
                 print(f"   ❌ Error reading remote config: {e}")
 
@@ -483,35 +552,12 @@ class UnityCloudAccountReader:
         }
 
         try:
-            # Try to read cloud code data
-            code_endpoints = [
-                f"{self.base_url}/projects/{self.project_id}/cloud-code",
-                f"{self.base_url}/projects/{self.project_id}/cloud-code/functions",
-            ]
-
-            session = requests.Session()
-            session.headers.update(
-                {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                }
-            )
-
-            for endpoint in code_endpoints:
-                try:
-                    response = session.get(endpoint, timeout=15)
-
-                    if response.status_code == 200:
-                        data = self.extract_cloud_code_data_from_response(response.text)
-                        if data:
-                            cloud_code_data["functions"].extend(data)
-
-                except Exception as e:
-                    print(f"   ❌ Error reading {endpoint}: {e}")
+            for endpoint in self.endpoints["cloud_code"]:
+                html_content = self.fetch_page(endpoint)
+                if html_content is not None:
+                    data = self.extract_cloud_code_data_from_response(html_content)
+                    if data:
+                        cloud_code_data["functions"].extend(data)
 
             # If we couldn't read from Unity Cloud, fall back to local data
             if not cloud_code_data["functions"]:
@@ -525,12 +571,13 @@ class UnityCloudAccountReader:
 
             # Display the data
             functions = cloud_code_data["functions"]
-            print(f"✅ Cloud Code Data: Found {len(functions)} functions")
+            lines = [f"✅ Cloud Code Data: Found {len(functions)} functions"]
 
             if functions:
-                print("   ☁️ Functions:")
-                for func in functions:
-                    print(f"     - {func}")
+                lines.append("   ☁️ Functions:")
+                lines.extend(f"     - {func}" for func in functions)
+
+            _emit(lines)
 
         except Exception as e:
             cloud_code_data["status"] = "error"
@@ -542,26 +589,7 @@ class UnityCloudAccountReader:
 
     def extract_cloud_code_data_from_response(self, html_content):
         """Extract cloud code data from HTML response"""
-        functions = []
-
-        # Look for function data
-        function_patterns = [
-            r'"id":"([^"]*function[^"]*)"',
-            r'"name":"([^"]*function[^"]*)"',
-            r'"id":"([^"]*script[^"]*)"',
-            r'"name":"([^"]*script[^"]*)"',
-            r"function[^>]*>([^<]+)<",
-            r"script[^>]*>([^<]+)<",
-            r"code[^>]*>([^<]+)<",
-        ]
-
-        for pattern in function_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                if match.strip() and len(match.strip()) > 1:
-                    functions.append(match.strip())
-
-        return list(set(functions))
+        return _extract_from_html(html_content, _FUNCTION_MARKERS)
 
     def read_local_cloud_code_data(self):
         """Read local cloud code data as reference"""
@@ -569,21 +597,21 @@ class UnityCloudAccountReader:
 
         # Read cloud code functions
         cloud_code_path = Path("/workspace/cloud-code")
-        if cloud_code_path.exists():
-            try:
-                function_files = list(cloud_code_path.glob("*.js"))
-                for func_file in function_files:
-                    functions.append(f"{func_file.stem}: {func_file.name}")
-            except Exception as e:
-                print(f"   ❌ Error reading cloud code: {e}")
+        try:
+            with os.scandir(cloud_code_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".js"):
+                        functions.append(f"{entry.name[:-3]}: {entry.name}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"   ❌ Error reading cloud code: {e}")
 
         return functions
 
     def generate_account_report(self):
         """Generate account report"""
-        print("\n" + "=" * 80)
-        print("📊 UNITY CLOUD ACCOUNT REPORT")
-        print("=" * 80)
+        lines = ["\n" + "=" * 80, "📊 UNITY CLOUD ACCOUNT REPORT", "=" * 80]
 
         total_services = len(self.results["account_data"])
         readable_services = 0
@@ -592,33 +620,34 @@ class UnityCloudAccountReader:
             status = service_data.get("status", "unknown")
             if status in ["cloud_data", "local_data"]:
                 readable_services += 1
-                print(f"✅ {service_name}: READABLE")
+                lines.append(f"✅ {service_name}: READABLE")
             elif status == "error":
-                print(
+                lines.append(
                     f"❌ {service_name}: ERROR - {service_data.get('error', 'Unknown error')}"
                 )
             else:
-                print(f"⚠️ {service_name}: {status.upper()}")
+                lines.append(f"⚠️ {service_name}: {status.upper()}")
 
-        print(f"\n📈 Summary:")
-        print(f"   Total Services: {total_services}")
-        print(f"   Readable: {readable_services}")
-        print(f"   Success Rate: {(readable_services/total_services)*100:.1f}%")
+        lines.append(f"\n📈 Summary:")
+        lines.append(f"   Total Services: {total_services}")
+        lines.append(f"   Readable: {readable_services}")
+        lines.append(f"   Success Rate: {(readable_services/total_services)*100:.1f}%")
 
         if readable_services == total_services:
-            print(
+            lines.append(
                 "\n🎉 FULL ACCOUNT ACCESS - Successfully read all Unity Cloud account data!"
             )
         elif readable_services > 0:
-            print(
+            lines.append(
                 f"\n✅ PARTIAL ACCOUNT ACCESS - Read {readable_services}/{total_services} services"
             )
         else:
-            print(
+            lines.append(
                 "\n❌ NO ACCOUNT ACCESS - Could not read any Unity Cloud account data"
             )
 
-        print("=" * 80)
+        lines.append("=" * 80)
+        _emit(lines)
 
     def save_results(self):
         """Save test results to file"""
@@ -628,8 +657,13 @@ class UnityCloudAccountReader:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         results_file = results_dir / f"unity_cloud_account_reader_{timestamp}.json"
 
-        with open(results_file, "w") as f:
-            json.dump(self.results, f, indent=2)
+        if orjson:
+            payload = orjson.dumps(self.results, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.results, indent=2, ensure_ascii=False).encode(
+                "utf-8"
+            )
+        results_file.write_bytes(payload)
 
         print(f"\n📁 Test results saved to: {results_file}")
 
@@ -637,7 +671,8 @@ class UnityCloudAccountReader:
         """Run all Unity Cloud account reads"""
         self.print_header()
 
-        # Read data from each service
+        # Fetch all service pages up front, then read data from each service
+        self.prefetch_pages()
         self.read_economy_data()
         self.read_remote_config_data()
         self.read_cloud_code_data()
@@ -5,12 +5,29 @@ Tests what your headless system can see on your Unity Cloud account
 """
 
 import csv
+import io
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
+
+def _load_file(path):
+    """Read a text file, returning the error instead of raising it"""
+    try:
+        return path.read_text()
+    except (OSError, ValueError) as e:
+        return e
+
 
 class HeadlessAccountVisibilityTester:
     def __init__(self):
@@ -42,6 +59,7 @@ class HeadlessAccountVisibilityTester:
             "email": self.email,
             "headless_visibility": {},
         }
+        self.files = {}
 
     def print_header(self):
         print("=" * 80)
@@ -54,6 +72,30 @@ class HeadlessAccountVisibilityTester:
         print(f"Timestamp: {self.results['timestamp']}")
         print("=" * 80)
 
+    def prefetch_files(self):
+        """Read every file the visibility tests parse concurrently"""
+        paths = [
+            self.unity_config_path,
+            self.economy_currencies_path,
+            self.economy_inventory_path,
+            self.economy_catalog_path,
+            self.remote_config_path,
+        ]
+        if self.cloud_code_path.is_dir():
+            paths.extend(self.cloud_code_path.glob("*.js"))
+        paths = [path for path in paths if path.is_file()]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.files.update(zip(paths, executor.map(_load_file, paths)))
+
+    def read_file(self, path):
+        """Return a prefetched file's text, reading it now if needed"""
+        if path not in self.files:
+            self.files[path] = _load_file(path)
+        content = self.files[path]
+        if isinstance(content, Exception):
+            raise content
+        return content
+
     def test_unity_cloud_account_visibility(self):
         """Test what your headless system can see on your Unity Cloud account"""
         print("\n🌐 Testing Unity Cloud Account Visibility...")
@@ -68,8 +110,7 @@ class HeadlessAccountVisibilityTester:
         # Test Unity Services configuration
         if self.unity_config_path.exists():
             try:
-                with open(self.unity_config_path, "r") as f:
-                    config_data = json.load(f)
+                config_data = _json_loads(self.read_file(self.unity_config_path))
 
                 account_visibility["account_data"]["unity_services"] = {
                     "project_id": config_data.get("projectId", ""),
@@ -119,7 +160,7 @@ class HeadlessAccountVisibilityTester:
         currencies = []
         if self.economy_currencies_path.exists():
             try:
-                with open(self.economy_currencies_path, "r") as f:
+                with io.StringIO(self.read_file(self.economy_currencies_path)) as f:
                     reader = csv.DictReader(f)
                     currencies = list(reader)
                     economy_visibility["economy_data"]["currencies"] = currencies
@@ -135,7 +176,7 @@ class HeadlessAccountVisibilityTester:
         inventory = []
         if self.economy_inventory_path.exists():
             try:
-                with open(self.economy_inventory_path, "r") as f:
+                with io.StringIO(self.read_file(self.economy_inventory_path)) as f:
                     reader = csv.DictReader(f)
                     inventory = list(reader)
                     economy_visibility["economy_data"]["inventory"] = inventory
@@ -151,7 +192,7 @@ class HeadlessAccountVisibilityTester:
         catalog = []
         if self.economy_catalog_path.exists():
             try:
-                with open(self.economy_catalog_path, "r") as f:
+                with io.StringIO(self.read_file(self.economy_catalog_path)) as f:
                     reader = csv.DictReader(f)
                     catalog = list(reader)
                     economy_visibility["economy_data"]["catalog"] = catalog
@@ -194,8 +235,7 @@ class HeadlessAccountVisibilityTester:
 
         if self.remote_config_path.exists():
             try:
-                with open(self.remote_config_path, "r") as f:
-                    config_data = json.load(f)
+                config_data = _json_loads(self.read_file(self.remote_config_path))
 
                 remote_config_visibility["config_data"] = config_data
 
@@ -240,8 +280,7 @@ class HeadlessAccountVisibilityTester:
 
                 for func_file in function_files:
                     try:
-                        with open(func_file, "r") as f:
-                            content = f.read()
+                        content = self.read_file(func_file)
 
                         function_info = {
                             "name": func_file.stem,
@@ -411,8 +450,14 @@ class HeadlessAccountVisibilityTester:
             results_dir / f"headless_account_visibility_test_{timestamp}.json"
         )
 
-        with open(results_file, "w") as f:
-            json.dump(self.results, f, indent=2)
+        if orjson is not None:
+            results_file.write_bytes(
+                orjson.dumps(self.results, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            results_file.write_bytes(
+                json.dumps(self.results, indent=2, ensure_ascii=False).encode("utf-8")
+            )
 
         print(f"\n📁 Test results saved to: {results_file}")
 
@@ -420,6 +465,9 @@ class HeadlessAccountVisibilityTester:
         """Run all headless account visibility tests"""
         self.print_header()
 
+        # Load the service files up front; the tests then report in order
+        self.prefetch_files()
+
         # Test each service
         self.test_unity_cloud_account_visibility()
         self.test_economy_service_visibility()
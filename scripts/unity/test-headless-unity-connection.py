@@ -6,12 +6,9 @@ Tests headless Unity Cloud integration without requiring API credentials
 
 import json
 import os
-import time
 from datetime import datetime
 from pathlib import Path
 
-import requests
-
 
 class HeadlessUnityConnectionTester:
     def __init__(self):
@@ -194,6 +191,9 @@ class HeadlessUnityConnectionTester:
                 field for field in required_fields if field not in config_data
             ]
 
+            # Look the economy section up once for all three counts
+            economy = config_data.get("economy") or {}
+
             test_result["details"] = {
                 "project_id": config_data.get("projectId", "NOT SET"),
                 "environment_id": config_data.get("environmentId", "NOT SET"),
@@ -201,13 +201,9 @@ class HeadlessUnityConnectionTester:
                     "cloudServicesAvailable", False
                 ),
                 "economy_configured": "economy" in config_data,
-                "currencies_count": len(
-                    config_data.get("economy", {}).get("currencies", [])
-                ),
-                "inventory_count": len(
-                    config_data.get("economy", {}).get("inventory", [])
-                ),
-                "catalog_count": len(config_data.get("economy", {}).get("catalog", [])),
+                "currencies_count": len(economy.get("currencies", ())),
+                "inventory_count": len(economy.get("inventory", ())),
+                "catalog_count": len(economy.get("catalog", ())),
             }
 
             if missing_fields: